@@ -0,0 +1,104 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:20:14
+Description: Precomputed anchor tables for integer-only doomsday calculations
+
+@author: tsenoner
+"""
+from typing import List, Tuple
+
+# doomsday of the century year, repeats every 400 years (1600, 2000, ...)
+CENTURY_ANCHORS: Tuple[int, ...] = (2, 0, 5, 3)
+
+# doomsday of every month, rows: [non-leap, leap]
+DOOMSDAYS: Tuple[Tuple[Tuple[int, int], ...], ...] = (
+    ((1, 3), (2, 28), (3, 14), (4, 4), (5, 9), (6, 6),
+     (7, 11), (8, 8), (9, 5), (10, 10), (11, 7), (12, 12)),
+    ((1, 4), (2, 29), (3, 14), (4, 4), (5, 9), (6, 6),
+     (7, 11), (8, 8), (9, 5), (10, 10), (11, 7), (12, 12)),
+)
+# doomsdays formatted as "MM/DD", rows: [non-leap, leap]
+DOOMSDAY_LABELS: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(f"{month:02d}/{day:02d}" for month, day in doomsdays) for doomsdays in DOOMSDAYS)
+# day of the year (0 based) of the first of every month, rows: [non-leap, leap]
+MONTH_STARTS: Tuple[Tuple[int, ...], ...] = (
+    (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334),
+    (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335),
+)
+
+
+def is_leap(year: int) -> bool:
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def day_of_year(year: int, month: int, day: int) -> int:
+    """Day of the year, 0 based"""
+    return MONTH_STARTS[is_leap(year)][month - 1] + day - 1
+
+
+def _build_anchor_index(leap: int) -> List[Tuple[str, int]]:
+    """(closest doomsday, signed diff) for every day of a year
+
+    On ties the earlier doomsday wins.
+    """
+    anchors = [(label, MONTH_STARTS[leap][month - 1] + day - 1)
+               for label, (month, day) in zip(DOOMSDAY_LABELS[leap], DOOMSDAYS[leap])]
+    index = []
+    for doy in range(365 + leap):
+        closest_doomsday, diff_to_doomsday = "", 365
+        for doomsday, anchor_doy in anchors:
+            diff = doy - anchor_doy
+            if abs(diff) < abs(diff_to_doomsday):
+                closest_doomsday, diff_to_doomsday = doomsday, diff
+        index.append((closest_doomsday, diff_to_doomsday))
+    return index
+
+
+# ANCHOR_INDEX[leap][day_of_year] -> (closest doomsday "MM/DD", signed diff)
+ANCHOR_INDEX: Tuple[List[Tuple[str, int]], ...] = (
+    _build_anchor_index(0), _build_anchor_index(1))
+# upper bounds of |diff to the closest doomsday| per bucket
+DISTANCE_BUCKETS: Tuple[int, ...] = (0, 3, 7, 14, 366)
+
+
+def century_doomsday(year: int) -> int:
+    return CENTURY_ANCHORS[year // 100 % 4]
+
+
+def doomsday_variables(year: int) -> Tuple[int, int, int, int, int, int, int]:
+    """All variables to calculate the doomsday of the given year"""
+    # STEP A
+    a = century_doomsday(year)
+    # STEP B
+    abbr_year = year % 100
+    b = abbr_year // 12
+    # STEP C
+    c = abbr_year % 12
+    # STEP D
+    d = c // 4
+    # STEP E
+    e = a + b + c + d
+    # domesday of this year
+    year_doomsday = e % 7
+    return a, abbr_year, b, c, d, e, year_doomsday
+
+
+def closest_doomsday(year: int, month: int, day: int) -> Tuple[str, int]:
+    leap = is_leap(year)
+    return ANCHOR_INDEX[leap][MONTH_STARTS[leap][month - 1] + day - 1]
+
+
+def distance_bucket(diff: int) -> int:
+    diff = abs(diff)
+    for bucket, upper in enumerate(DISTANCE_BUCKETS):
+        if diff <= upper:
+            return bucket
+    return len(DISTANCE_BUCKETS) - 1
+
+
+def weekday(year: int, month: int, day: int) -> int:
+    """Weekday as int (0 = Sunday)"""
+    *_, year_doomsday = doomsday_variables(year)
+    _, diff = closest_doomsday(year, month, day)
+    return (year_doomsday + diff) % 7
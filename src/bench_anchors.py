@@ -0,0 +1,67 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:20:14
+Description: Per-date cost of the table-driven `Doomsday` vs. the steps of
+             the former strptime/date based implementation
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import timeit
+
+from bench_batch import random_dates
+from doomsday import Doomsday
+
+DOOMSDAYS = ["03/14", "04/04", "05/09", "06/06",
+             "07/11", "08/08", "09/05", "10/10", "11/07", "12/12"]
+
+
+def strptime_weekday(date: datetime.date) -> int:
+    """The steps of the previous `Doomsday.get_weekday` (strptime per anchor)
+
+    Unlike the previous code it uses the 400-year leap rule (2000 was a
+    common year there), so that both sides give the same weekdays; it also
+    skips building a `Doomsday` object, so the speedup is a lower bound.
+    """
+    year = date.year
+    doomsdays = (["01/04", "02/29"] if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+                 else ["01/03", "02/28"]) + DOOMSDAYS
+    century_doomsday = datetime.date(year // 100 * 100, 4, 4).isoweekday() % 7
+    abbr_year = year % 100
+    c = abbr_year % 12
+    year_doomsday = (century_doomsday + abbr_year // 12 + c + c // 4) % 7
+    diff_to_doomsday = 365
+    for doomsday in doomsdays:
+        doomsday_date = datetime.datetime.strptime(f"{year}/{doomsday}", "%Y/%m/%d").date()
+        diff = (date - doomsday_date).days
+        if abs(diff) < abs(diff_to_doomsday):
+            diff_to_doomsday = diff
+    return (year_doomsday + diff_to_doomsday) % 7
+
+
+def table_weekday(date: datetime.date) -> int:
+    return Doomsday(date).get_weekday()[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=20_000, help="number of dates")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    dates = random_dates(args.n)
+    assert [strptime_weekday(date) for date in dates] == [table_weekday(date) for date in dates]
+
+    results = {}
+    for name, func in (("strptime", strptime_weekday), ("table", table_weekday)):
+        seconds = min(timeit.repeat(lambda: [func(date) for date in dates],
+                                    number=1, repeat=args.repeat))
+        results[name] = seconds / args.n * 1e6
+        print(f"{name:<8}{results[name]:>8.2f} us/date")
+    print(f"speedup: {results['strptime'] / results['table']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
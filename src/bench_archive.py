@@ -0,0 +1,94 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:49:46
+Description: Hot-path query times with a growing history, once with every
+             attempt in the hot database and once after moving everything
+             older than a year to the monthly archives
+
+usage:
+    python src/bench_archive.py --rows-per-year 50000 --years 1 4 16
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import itertools
+import statistics
+import time
+from typing import Callable, Dict
+
+from db_api import Database
+from synthetic import generate
+
+BENCH_DB = "bench_archive"
+
+
+def timed(func: Callable, repeat: int) -> float:
+    """Median wall time of `func` in milliseconds"""
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds) * 1e3
+
+
+def hot_path(db: Database, now: datetime.datetime, repeat: int) -> Dict[str, float]:
+    last_week = now - datetime.timedelta(days=7)
+    return {
+        "is_not_empty": timed(db.is_not_empty, repeat),
+        "user_stats": timed(db.get_user_stats, repeat),
+        "accuracy(month)": timed(lambda: db.get_accuracy("month"), repeat),
+        "daily_summary": timed(db.get_daily_summary, repeat),
+        "last_week": timed(lambda: list(db.iter_range(last_week, now)), repeat),
+        "all_data": timed(db.get_all_data, repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows-per-year", type=int, default=50_000)
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 4, 16],
+                        help="history lengths")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    now = datetime.datetime.now()
+    results = {}
+    for years in args.years:
+        Database.remove_files(BENCH_DB)
+        with Database(BENCH_DB) as db:
+            start = now - datetime.timedelta(days=365.25 * years)
+            # one import, the indexes are rebuilt once
+            db.bulk_import(itertools.chain.from_iterable(
+                generate(args.rows_per_year * years, args.seed, start, years)))
+            results[(years, "single file")] = hot_path(db, now, args.repeat)
+
+            start_time = time.perf_counter()
+            n_rows = db.archive()
+            archive_seconds = time.perf_counter() - start_time
+            results[(years, "archived")] = hot_path(db, now, args.repeat)
+            # a range reaching into one archive attaches only that month
+            year_ago = now - datetime.timedelta(days=400)
+            results[(years, "archived")]["archived_week"] = timed(
+                lambda: list(db.iter_range(year_ago, year_ago + datetime.timedelta(days=7))),
+                args.repeat)
+            size = Database.path_of(BENCH_DB).stat().st_size / 2**20
+            print(f"{years:>2} years: archived {n_rows:,} rows into "
+                  f"{len(db.archive_months())} files in {archive_seconds:.2f} s, "
+                  f"hot database {size:.1f} MiB")
+    Database.remove_files(BENCH_DB)
+
+    queries = list(results[(args.years[-1], "archived")])
+    print(f"\n{'ms':<16}" + "".join(f"{f'{years}y {layout}':>22}"
+                                     for years, layout in results))
+    for query in queries:
+        print(f"{query:<16}" + "".join(
+            f"{timings[query]:>22.3f}" if query in timings else f"{'-':>22}"
+            for timings in results.values()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:18:45
+Description: Throughput of the vectorized doomsday engine vs. `Doomsday`
+
+@author: tsenoner
+"""
+import argparse
+import time
+from random import Random
+
+import numpy as np
+
+from doomsday import Doomsday, random_date
+from doomsday_batch import batch_doomsday
+
+
+def random_dates(n: int, seed: int = 0, start_year: int = 1500, end_year: int = 2500):
+    rng = Random(seed)
+    return [random_date(start_year, end_year, rng) for _ in range(n)]
+
+
+def scalar_path(dates):
+    return [Doomsday(date).get_weekday()[0] for date in dates]
+
+
+def batch_path(dates):
+    return batch_doomsday(np.asarray(dates, dtype="datetime64[D]")).weekday
+
+
+def best_of(func, dates, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(dates)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=100_000, help="number of dates")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    dates = random_dates(args.n, args.seed)
+    # both paths have to agree before their speed is worth comparing
+    assert list(batch_path(dates)) == scalar_path(dates), "engines disagree"
+
+    scalar = best_of(scalar_path, dates, args.repeat)
+    batch = best_of(batch_path, dates, args.repeat)
+    print(f"{'path':<10}{'seconds':>10}{'dates/s':>15}")
+    print(f"{'scalar':<10}{scalar:>10.3f}{args.n / scalar:>15,.0f}")
+    print(f"{'batch':<10}{batch:>10.3f}{args.n / batch:>15,.0f}")
+    print(f"speedup: {scalar / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:21:30
+Description: Insert throughput and latency of the synchronous vs. the
+             write-behind `Database`, against the former rollback journal
+             with a full fsync per commit as the baseline
+
+@author: tsenoner
+"""
+import argparse
+import time
+
+from bench_batch import random_dates
+from db_api import Database
+
+BENCH_DB = "bench_insert"
+
+
+def run(dates, write_behind: bool, rollback_journal: bool = False) -> dict:
+    Database.remove_files(BENCH_DB)
+    latencies = []
+    start = time.perf_counter()
+    with Database(BENCH_DB, write_behind=write_behind) as db:
+        if rollback_journal:
+            # the settings before WAL: journal file and fsync on every commit
+            db.con.execute("PRAGMA journal_mode=DELETE;").fetchall()
+            db.con.execute("PRAGMA synchronous=FULL;")
+        for date in dates:
+            # the part of `GUI.submit` that touches the database
+            call_start = time.perf_counter()
+            db.insert(date=date, real_day="Monday", guessed_day="Monday")
+            latencies.append(time.perf_counter() - call_start)
+    total = time.perf_counter() - start  # includes the final flush on close
+    Database.remove_files(BENCH_DB)
+    latencies.sort()
+    return {
+        "inserts/s": len(dates) / total,
+        "p50 ms": latencies[len(latencies) // 2] * 1e3,
+        "p99 ms": latencies[int(len(latencies) * 0.99)] * 1e3,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=2_000, help="number of inserts")
+    args = parser.parse_args()
+
+    dates = random_dates(args.n)
+    print(f"{'mode':<18}{'inserts/s':>12}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, write_behind, rollback_journal in (("rollback journal", False, True),
+                                                 ("synchronous WAL", False, False),
+                                                 ("write-behind WAL", True, False)):
+        result = run(dates, write_behind, rollback_journal)
+        print(f"{name:<18}{result['inserts/s']:>12,.0f}"
+              f"{result['p50 ms']:>10.3f}{result['p99 ms']:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:44:14
+Description: Side by side comparison of the registered weekday engines on
+             the same date sets: throughput, steps per date and agreement
+             with `datetime`
+
+usage:
+    python src/bench_engines.py -n 50000 --engines doomsday zeller gauss
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import random
+import time
+from typing import Dict, List
+
+from engines import ENGINES, get_engine
+
+
+def date_sets(n: int, seed: int) -> Dict[str, List[datetime.date]]:
+    rng = random.Random(seed)
+    first = datetime.date(1500, 1, 1).toordinal()
+    last = datetime.date(2500, 12, 31).toordinal()
+    full_first = datetime.date(datetime.MINYEAR, 1, 1).toordinal()
+    full_last = datetime.date(datetime.MAXYEAR, 12, 31).toordinal()
+    return {
+        "1500-2500": [datetime.date.fromordinal(rng.randint(first, last)) for _ in range(n)],
+        "1-9999": [datetime.date.fromordinal(rng.randint(full_first, full_last))
+                   for _ in range(n)],
+        # evenly spread over a 400-year cycle, including all leap year rules
+        "2000-2399": [datetime.date(2000, 1, 1) + datetime.timedelta(days=offset)
+                      for offset in range(0, 146_097, max(146_097 // n, 1))][:n],
+    }
+
+
+def bench(name: str, dates: List[datetime.date], n_explain: int) -> dict:
+    engine = get_engine(name)
+    ymd = [(date.year, date.month, date.day) for date in dates]
+    engine.weekday(*ymd[0])  # e.g. map the table before timing
+
+    start = time.perf_counter()
+    weekdays = [engine.weekday(*args) for args in ymd]
+    weekday_seconds = time.perf_counter() - start
+
+    sample = dates[:n_explain]
+    start = time.perf_counter()
+    solutions = [engine.explain(date) for date in sample]
+    explain_seconds = time.perf_counter() - start
+
+    agree = sum(weekday == date.isoweekday() % 7 for weekday, date in zip(weekdays, dates))
+    agree += sum(solution.weekday_int == date.isoweekday() % 7
+                 for solution, date in zip(solutions, sample))
+    return {
+        "dates_per_s": len(dates) / weekday_seconds,
+        "explain_us": explain_seconds / len(sample) * 1e6,
+        "steps": sum(len(solution.steps) for solution in solutions) / len(sample),
+        "lines": sum(len(step.lines) for solution in solutions
+                     for step in solution.steps) / len(sample),
+        "agreement": agree / (len(dates) + len(sample)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the weekday engines")
+    parser.add_argument("-n", type=int, default=50_000, help="dates per set")
+    parser.add_argument("--explain", type=int, default=5_000,
+                        help="dates per set that are also explained")
+    parser.add_argument("--engines", nargs="+", choices=ENGINES, default=list(ENGINES))
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    for set_name, dates in date_sets(args.n, args.seed).items():
+        print(f"\n{set_name}: {len(dates):,} dates")
+        print(f"{'engine':<10}{'dates/s':>12}{'explain us':>12}{'steps':>7}"
+              f"{'lines':>7}{'agreement':>11}")
+        for name in args.engines:
+            result = bench(name, dates, args.explain)
+            print(f"{name:<10}{result['dates_per_s']:>12,.0f}{result['explain_us']:>12.2f}"
+                  f"{result['steps']:>7.1f}{result['lines']:>7.1f}{result['agreement']:>11.4%}")
+
+
+if __name__ == "__main__":
+    main()
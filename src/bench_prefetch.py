@@ -0,0 +1,84 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:42:22
+Description: Submit-to-next-question latency of the synchronous submit path
+             vs. write-behind inserts plus the prefetched question pipeline
+
+Runs the work of `GUI.submit` headless: check the answer, update the
+scheduler, store the attempt and show the next date (with its explanation).
+
+@author: tsenoner
+"""
+import argparse
+import random
+import time
+
+from db_api import Database
+from doomsday import Doomsday, explain_date, parse_weekday
+from instrumentation import Histogram
+from prefetch import QuestionPipeline
+from scheduler import Scheduler
+
+BENCH_DB = "bench_prefetch"
+
+
+def synchronous(n: int, think: float, rng: random.Random) -> Histogram:
+    """Previous path: synchronous insert, next date and explanation on the critical path"""
+    histogram = Histogram()
+    scheduler = Scheduler(rng=random.Random(0))
+    with Database(BENCH_DB) as db:
+        date = scheduler.next_date()
+        for _ in range(n):
+            time.sleep(think)
+            start = time.perf_counter()
+            guess = parse_weekday(rng.choice(Doomsday.weekdays))
+            actual = explain_date(date).weekday_int
+            scheduler.record(date, guess == actual)
+            db.insert(date, actual, guess)
+            date = scheduler.next_date()
+            explain_date(date)
+            histogram.add((time.perf_counter() - start) * 1e6)
+    return histogram
+
+
+def prefetched(n: int, think: float, rng: random.Random) -> Histogram:
+    histogram = Histogram()
+    with Database(BENCH_DB, write_behind=True) as db, \
+            QuestionPipeline(Scheduler(rng=random.Random(0))) as pipeline:
+        question = pipeline.next()
+        for _ in range(n):
+            time.sleep(think)
+            start = time.perf_counter()
+            guess = parse_weekday(rng.choice(Doomsday.weekdays))
+            pipeline.record(question.date, guess == question.weekday_int)
+            db.insert(question.date, question.weekday_int, guess)
+            question = pipeline.next()
+            histogram.add((time.perf_counter() - start) * 1e6)
+        print(f"prefetch queue: {pipeline.hits} hits, {pipeline.misses} misses")
+    return histogram
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=2_000, help="answers")
+    parser.add_argument("--think-ms", type=float, default=5.0,
+                        help="time between two answers")
+    args = parser.parse_args()
+
+    results = {}
+    for name, func in (("synchronous", synchronous), ("prefetched", prefetched)):
+        Database.remove_files(BENCH_DB)
+        explain_date.cache_clear()
+        results[name] = func(args.n, args.think_ms / 1e3, random.Random(0))
+    Database.remove_files(BENCH_DB)
+
+    print(f"{'path':<14}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, hist in results.items():
+        print(f"{name:<14}{hist.total / hist.count / 1e3:>10.3f}"
+              f"{hist.percentile(0.50) / 1e3:>10.3f}{hist.percentile(0.95) / 1e3:>10.3f}"
+              f"{hist.percentile(0.99) / 1e3:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
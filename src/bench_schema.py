@@ -0,0 +1,102 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:29:43
+Description: Database size and full-scan speed of the legacy TEXT schema
+             vs. the integer schema after the in-place migration
+
+The integer `dates` table is about half the size of the legacy one, but the
+file as a whole is larger: the time and accuracy indexes and the rollups
+added since cost more than the table saves. Both are reported.
+
+@author: tsenoner
+"""
+import argparse
+import sqlite3
+import time
+from typing import Tuple
+
+from db_api import WEEKDAYS, Database
+from synthetic import generate
+
+BENCH_DB = "bench_schema"
+
+
+def create_legacy(n_rows: int, seed: int) -> None:
+    """Schema 1: converter based timestamp/date and TEXT weekdays"""
+    con = sqlite3.connect(Database.path_of(BENCH_DB))
+    con.execute("""
+        CREATE TABLE dates (
+            time timestamp,
+            date date,
+            real_day TEXT,
+            guessed_day TEXT,
+            correct NULL);
+        """)
+    for rows in generate(n_rows, seed):
+        con.executemany("INSERT INTO dates VALUES (?, ?, ?, ?, ?);", [
+            (time_.isoformat(" "), date.isoformat(), WEEKDAYS[real], WEEKDAYS[guessed], correct)
+            for time_, date, real, guessed, correct in rows])
+    con.commit()
+    con.close()
+
+
+def legacy_scan() -> float:
+    con = sqlite3.connect(Database.path_of(BENCH_DB),
+                          detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+    start = time.perf_counter()
+    con.execute("SELECT rowid, * FROM dates").fetchall()
+    seconds = time.perf_counter() - start
+    con.close()
+    return seconds
+
+
+def sizes(path) -> Tuple[int, int]:
+    """Bytes of the `dates` table and of everything else (indexes, rollups)"""
+    con = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    table, total = con.execute(
+        "SELECT SUM(pgsize * (name = 'dates')), SUM(pgsize) FROM dbstat;").fetchone()
+    con.close()
+    return table, total - table
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=500_000, help="rows")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    Database.remove_files(BENCH_DB)
+    create_legacy(args.n, args.seed)
+    path = Database.path_of(BENCH_DB)
+    legacy_size = path.stat().st_size
+    legacy_table, legacy_other = sizes(path)
+    legacy_seconds = legacy_scan()
+
+    migrate_seconds = timed(lambda: Database(BENCH_DB).close())
+    new_size = path.stat().st_size
+    new_table, new_other = sizes(path)
+    with Database(BENCH_DB) as db:
+        raw_seconds = timed(db.get_all_data)
+        decoded_seconds = timed(lambda: db.get_all_data(decode=True))
+    Database.remove_files(BENCH_DB)
+
+    mib = 1024 ** 2
+    print(f"{args.n:,} rows, migration took {migrate_seconds:.2f} s")
+    print(f"{'schema':<22}{'file MiB':>10}{'table MiB':>11}{'indexes, rollups':>18}"
+          f"{'full scan s':>13}")
+    print(f"{'legacy (converters)':<22}{legacy_size / mib:>10.1f}{legacy_table / mib:>11.1f}"
+          f"{legacy_other / mib:>18.1f}{legacy_seconds:>13.3f}")
+    print(f"{'integer (raw)':<22}{new_size / mib:>10.1f}{new_table / mib:>11.1f}"
+          f"{new_other / mib:>18.1f}{raw_seconds:>13.3f}")
+    print(f"{'integer (decoded)':<22}{'':>10}{'':>11}{'':>18}{decoded_seconds:>13.3f}")
+
+
+if __name__ == "__main__":
+    main()
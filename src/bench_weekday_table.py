@@ -0,0 +1,54 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:40:55
+Description: Weekday lookups in the memory-mapped table vs. the arithmetic
+             paths (`Doomsday.get_weekday`, `anchors.weekday`, numpy batch)
+
+@author: tsenoner
+"""
+import argparse
+import timeit
+
+import anchors
+from bench_batch import random_dates
+from doomsday import Doomsday
+from doomsday_batch import batch_weekdays
+from weekday_table import open_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=100_000, help="number of dates")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    dates = random_dates(args.n)
+    ymd = [(date.year, date.month, date.day) for date in dates]
+    with open_table() as table:
+        import numpy as np
+        ordinals = np.array([date.toordinal() for date in dates], dtype=np.int64)
+        candidates = {
+            "Doomsday.get_weekday": lambda: [Doomsday(date).get_weekday()[0] for date in dates],
+            "anchors.weekday": lambda: [anchors.weekday(*args) for args in ymd],
+            "table.weekday": lambda: [table.weekday(*args) for args in ymd],
+            "table.weekday_of": lambda: [table.weekday_of(date) for date in dates],
+            "batch_weekdays": lambda: batch_weekdays(dates),
+            "table.weekdays (ordinals)": lambda: table.weekdays(ordinals),
+        }
+        expected = candidates["Doomsday.get_weekday"]()
+        for name, func in candidates.items():
+            assert list(func()) == expected, name
+
+        results = {}
+        for name, func in candidates.items():
+            seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+            results[name] = seconds / args.n * 1e9
+    baseline = results["Doomsday.get_weekday"]
+    print(f"{'path':<28}{'ns/date':>10}{'speedup':>10}")
+    for name, ns in results.items():
+        print(f"{name:<28}{ns:>10.1f}{baseline / ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:24:35
+Description: Headless benchmark suite for the algorithm, storage and
+             statistics hot paths with JSON results and regression check
+
+usage:
+    python src/benchmark.py run -o results.json [--sizes 1000 100000]
+    python src/benchmark.py compare old.json new.json [--threshold 0.1]
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+import time
+from random import Random
+from typing import Callable, Dict, List
+
+from db_api import Database
+from doomsday import EXPLANATION_CACHE_SIZE, Doomsday, explain_date, random_date
+from progress import render_progress
+from synthetic import generate
+
+BENCH_DB = "bench_suite"
+
+
+def measure(func: Callable[[], object], ops: int, repeat: int = 3) -> dict:
+    """Best of `repeat` runs of `func`, which performs `ops` operations"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    seconds = min(timings)
+    return {"ops": ops, "seconds": seconds, "us_per_op": seconds / ops * 1e6}
+
+
+def fill(db: Database, n_rows: int, seed: int) -> None:
+    """Append `n_rows` synthetic attempts spread over the last two years"""
+    start = datetime.datetime.now() - datetime.timedelta(days=730)
+    for rows in generate(n_rows, seed, start, years=2):
+        db.insert_many(rows)
+
+
+def bench_cached_explain(dates: list) -> dict:
+    """`explain_date` on a working set that fits into its LRU cache"""
+    working_set = dates[:EXPLANATION_CACHE_SIZE]
+    repeated = [working_set[idx % len(working_set)] for idx in range(len(dates))]
+    explain_date.cache_clear()
+    for date in working_set:
+        explain_date(date)
+    warm = explain_date.cache_info()
+    result = measure(lambda: [explain_date(date) for date in repeated], len(repeated))
+    info = explain_date.cache_info()
+    hits, misses = info.hits - warm.hits, info.misses - warm.misses
+    result["hit_rate"] = hits / (hits + misses)
+    return result
+
+
+def bench_algorithm(n: int, rng: Random) -> Dict[str, dict]:
+    dates = [random_date(rng=rng) for _ in range(n)]
+    doomsdays = [Doomsday(date) for date in dates]
+    return {
+        "doomsday.get_weekday": measure(
+            lambda: [doom.get_weekday() for doom in doomsdays], n),
+        "doomsday.get_closest_domesday": measure(
+            lambda: [doom.get_closest_domesday() for doom in doomsdays], n),
+        "doomsday.explain": measure(
+            lambda: [Doomsday(date).explain() for date in dates], n),
+        "doomsday.explain_date.cached": bench_cached_explain(dates),
+        "doomsday.random_date": measure(
+            lambda: [random_date(rng=rng) for _ in range(n)], n),
+    }
+
+
+def bench_storage(sizes: List[int], rng: Random, n_inserts: int) -> Dict[str, dict]:
+    results = {}
+    for kind in ("memory", "disk"):
+        for size in sizes:
+            Database.remove_files(BENCH_DB)
+            db = Database() if kind == "memory" else Database(BENCH_DB)
+            fill(db, size, rng.randrange(2**32))
+            date = random_date(rng=rng)
+            prefix = f"db.{kind}.{size}"
+            results[f"{prefix}.insert"] = measure(
+                lambda: [db.insert(date, "Monday", "Monday") for _ in range(n_inserts)],
+                n_inserts, repeat=1)
+            results[f"{prefix}.is_not_empty"] = measure(db.is_not_empty, 1)
+            results[f"{prefix}.get_all_data"] = measure(db.get_all_data, 1, repeat=1)
+            results[f"{prefix}.show_progress.aggregate"] = measure(db.get_daily_summary, 1)
+            summary = db.get_daily_summary()
+            results[f"{prefix}.show_progress.render"] = measure(
+                lambda: render_progress(summary), 1, repeat=1)
+            db.close()
+    Database.remove_files(BENCH_DB)
+    return results
+
+
+def run(args) -> None:
+    rng = Random(args.seed)
+    results = {}
+    results.update(bench_algorithm(args.n, rng))
+    results.update(bench_storage(args.sizes, rng, args.inserts))
+    report = {
+        "meta": {
+            "created": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": {"n": args.n, "sizes": args.sizes, "inserts": args.inserts,
+                     "seed": args.seed},
+        },
+        "results": results,
+    }
+    for name, result in results.items():
+        hit_rate = f"  ({result['hit_rate']:.1%} cache hits)" if "hit_rate" in result else ""
+        print(f"{name:<48}{result['us_per_op']:>14,.2f} us/op{hit_rate}")
+    if args.output:
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+
+
+def compare(args) -> None:
+    with open(args.old) as handle:
+        old = json.load(handle)["results"]
+    with open(args.new) as handle:
+        new = json.load(handle)["results"]
+    regressions = 0
+    for name in sorted(old.keys() & new.keys()):
+        ratio = new[name]["us_per_op"] / old[name]["us_per_op"]
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "REGRESSION"
+            regressions += 1
+        print(f"{name:<48}{old[name]['us_per_op']:>12,.2f}{new[name]['us_per_op']:>12,.2f}"
+              f"{ratio:>8.2f}x  {flag}")
+    for name in sorted(old.keys() ^ new.keys()):
+        print(f"{name:<48} only in {'old' if name in old else 'new'} run")
+    if regressions:
+        print(f"{regressions} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DayOfDate benchmark suite")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="write the results as JSON")
+    run_parser.add_argument("-n", type=int, default=20_000,
+                            help="dates for the algorithm benchmarks")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                            help="rows in the benchmark databases (up to 10M)")
+    run_parser.add_argument("--inserts", type=int, default=1_000,
+                            help="inserts timed per database")
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.set_defaults(func=run)
+
+    compare_parser = subparsers.add_parser("compare", help="compare two runs")
+    compare_parser.add_argument("old")
+    compare_parser.add_argument("new")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="relative slow down reported as regression")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:23:17
+Description: Cached, pre-scaled cheatsheet image for the info window
+
+@author: tsenoner
+"""
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Tuple
+
+if TYPE_CHECKING:
+    from PIL import Image  # imported on first use, see `load_cheatsheet`
+
+DOC_DIR = Path(__file__).parents[1] / "doc"
+SOURCE_PNG = DOC_DIR / "universal_cal.png"
+SOURCE_SVG = DOC_DIR / "universal_cal.svg"
+CACHE_DIR = DOC_DIR / "cache"
+
+# (source, size, source mtime) -> PIL image, kept for the session
+_images: Dict[Tuple[Path, Tuple[int, int], int], "Image.Image"] = {}
+
+
+def _cache_prefix(source: Path, size: Tuple[int, int]) -> str:
+    width, height = size
+    return f"{source.stem}_{source.suffix[1:]}_{width}x{height}"
+
+
+def _cache_path(source: Path, size: Tuple[int, int], mtime_ns: int) -> Path:
+    return CACHE_DIR / f"{_cache_prefix(source, size)}_{mtime_ns}.png"
+
+
+def _rasterize_svg(source: Path, size: Tuple[int, int]) -> bytes:
+    import cairosvg  # optional dependency, only needed for use_svg=True
+    width, height = size
+    return cairosvg.svg2png(url=str(source), output_width=width, output_height=height)
+
+
+def load_cheatsheet(size: Tuple[int, int], use_svg: bool = False) -> "Image.Image":
+    """Cheatsheet scaled to `size`
+
+    Lookup order: in-memory cache, derived file in `doc/cache/`, resample of
+    the source. With `use_svg` the SVG is rasterized at exactly `size`
+    (needs `cairosvg`, falls back to the PNG otherwise).
+    """
+    from PIL import Image
+
+    source = SOURCE_PNG
+    if use_svg:
+        try:
+            import cairosvg  # noqa: F401
+            source = SOURCE_SVG
+        except ImportError:
+            print("cairosvg is not installed, using the PNG cheatsheet.")
+    size = tuple(size)
+    mtime_ns = source.stat().st_mtime_ns
+    key = (source, size, mtime_ns)
+    if key in _images:
+        return _images[key]
+
+    cache_path = _cache_path(source, size, mtime_ns)
+    if cache_path.exists():
+        image = Image.open(cache_path)
+        image.load()
+    else:
+        if source == SOURCE_SVG:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_bytes(_rasterize_svg(source, size))
+            image = Image.open(cache_path)
+            image.load()
+        else:
+            image = Image.open(source).resize(size)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            image.save(cache_path)
+        # drop derived files of older versions of the source at this size
+        for stale in CACHE_DIR.glob(f"{_cache_prefix(source, size)}_*.png"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    _images[key] = image
+    return image
+
+
+def main():
+    image = load_cheatsheet((770, 620))
+    print(image.size, sorted(path.name for path in CACHE_DIR.iterdir()))
+
+
+if __name__ == "__main__":
+    main()
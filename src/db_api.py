@@ -6,10 +6,67 @@ Description: API to database
 
 @author: tsenoner
 """
+import argparse
+import bisect
+import contextlib
 import datetime
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
-from typing import Iterable, List
+from itertools import islice
+from typing import Iterable, Iterator, List, Tuple
+
+import anchors
+import instrumentation
+
+SCHEMA_VERSION = 4
+WEEKDAYS: List[str] = ["Sunday", "Monday", "Tuesday", "Wednesday",
+                       "Thursday", "Friday", "Saturday"]
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+MS_PER_DAY = 86_400_000
+# stored attempt columns, without the derived date columns (year, leap, doy)
+COLUMNS = "time, date, real_day, guessed_day, correct, user"
+ACCURACY_CATEGORIES: Tuple[str, ...] = ("century", "month", "weekday", "leap", "distance")
+
+
+def encode_time(time_: datetime.datetime) -> int:
+    """Naive (local) datetime -> epoch milliseconds"""
+    return (time_ - EPOCH) // datetime.timedelta(milliseconds=1)
+
+
+def decode_time(ms: int) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(milliseconds=ms)
+
+
+def encode_weekday(day) -> int:
+    """Weekday name (any case) or int -> int (0 = Sunday)"""
+    if isinstance(day, int):
+        return day
+    return WEEKDAYS.index(day.capitalize())
+
+
+def encode_date(date: datetime.date) -> Tuple[int, int, int]:
+    """Derived (year, leap, day of the year) columns of a date, for the analytics indexes"""
+    leap = int(anchors.is_leap(date.year))
+    return date.year, leap, anchors.MONTH_STARTS[leap][date.month - 1] + date.day - 1
+
+
+def encode_row(row: tuple) -> tuple:
+    """(time, date, real_day, guessed_day, correct[, user]) -> stored values"""
+    time_, date, real_day, guessed_day, correct, *user = row
+    return (encode_time(time_), date.toordinal(), encode_weekday(real_day),
+            encode_weekday(guessed_day), int(correct), user[0] if user else None,
+            *encode_date(date))
+
+
+def decode_row(row: tuple) -> tuple:
+    """Stored (rowid, time, date, real_day, guessed_day, correct, ...) -> Python objects"""
+    rowid, time_, date, real_day, guessed_day, correct, *rest = row
+    return (rowid, decode_time(time_), datetime.date.fromordinal(date),
+            WEEKDAYS[real_day], WEEKDAYS[guessed_day], correct, *rest)
 
 
 class Database:
@@ -18,11 +75,110 @@ class Database:
     con: bool = None
     cur: bool = None
 
-    def __init__(self, db_name: str = None) -> None:
+    insert_query: str = f"""
+        INSERT INTO dates ({COLUMNS}, year, leap, doy)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);
+        """
+    # secondary indexes of `dates`, dropped and rebuilt around bulk imports;
+    # all end in `correct`, so the accuracy queries never touch the table
+    indexes: dict = {
+        "dates_year": "CREATE INDEX IF NOT EXISTS dates_year ON dates (year, correct);",
+        "dates_day": "CREATE INDEX IF NOT EXISTS dates_day ON dates (leap, doy, correct);",
+        "dates_weekday":
+            "CREATE INDEX IF NOT EXISTS dates_weekday ON dates (real_day, correct);",
+        # time ranges of `iter_range` and `archive`
+        "dates_time": "CREATE INDEX IF NOT EXISTS dates_time ON dates (time);",
+    }
+    # only for `multi_user` databases, `user` is always NULL in the local app
+    user_indexes: dict = {
+        "dates_user": "CREATE INDEX IF NOT EXISTS dates_user ON dates (user, correct);",
+    }
+
+    # schema 4: time in epoch ms, date as proleptic ordinal,
+    # weekdays as 0 (Sunday) - 6, correct as 0/1, the (optional) user and
+    # year, leap (0/1) and doy (day of the year, 0 based) of `date`
+    create_table_query: str = """
+        CREATE TABLE IF NOT EXISTS {schema}dates (
+            time INTEGER,
+            date INTEGER,
+            real_day INTEGER,
+            guessed_day INTEGER,
+            correct INTEGER,
+            user TEXT,
+            year INTEGER,
+            leap INTEGER,
+            doy INTEGER);
+        """
+
+    write_behind:   bool = False
+    batch_size:     int = 256
+    flush_interval: float = 0.5
+    # a failed batch is retried this often (delay doubling) before the
+    # error is raised to the caller; the rows are kept for the next batch
+    write_retries:  int = 3
+    retry_delay:    float = 0.1
+    # attempts older than this are moved to the monthly archives by `archive()`
+    archive_after_days: int = 365
+    # `archive(min_rows=...)` leaves fewer due attempts than this in place
+    archive_min_rows: int = 10_000
+    # archives attached at once by `iter_range` (SQLite's limit is 10)
+    max_attached: int = 8
+    # idle read-only connections kept open for the read methods
+    read_connections: int = 2
+
+    def __init__(self, db_name: str = None, write_behind: bool = False,
+                 batch_size: int = None, flush_interval: float = None,
+                 multi_user: bool = False) -> None:
+        """Open (or create) the database `data/<db_name>.db`
+
+        With `write_behind` inserts are only queued; a background thread
+        writes them with `executemany` once `batch_size` rows are pending or
+        `flush_interval` seconds have passed, and on `flush()`/`close()`.
+
+        All writes go through one connection (`con`, guarded by a lock). Reads
+        of a database file run on pooled read-only connections, so a long
+        statistics query or export neither waits for nor delays the writer.
+
+        `multi_user` databases (the quiz server) also index the `user` column
+        for `get_user_stats`.
+        """
         if db_name is not None:
-            self.path_db = Path(__file__).parents[1] / "data" / f"{db_name}.db"
+            self.path_db = self.path_of(db_name)
+        self.write_behind = write_behind
+        self.multi_user = multi_user
+        if multi_user:
+            self.indexes = {**self.indexes, **self.user_indexes}
+        if batch_size is not None:
+            self.batch_size = batch_size
+        if flush_interval is not None:
+            self.flush_interval = flush_interval
+        self.__lock = threading.RLock()
+        self.__last_rowid = None
+        self.__queue = queue.Queue()
+        self.__writer = None
+        self.__write_error = None  # last failed write of the writer thread
+        self.__archive_months = None  # listed once, then kept up to date by `archive`
+        self.__readers = queue.LifoQueue()
+        self.__closed = False
         self.__connect()
         self.__create_table()
+        if self.write_behind:
+            self.__writer = threading.Thread(target=self.__write_loop,
+                                             name="db-writer", daemon=True)
+            self.__writer.start()
+
+    @staticmethod
+    def path_of(db_name: str) -> Path:
+        return Path(__file__).parents[1] / "data" / f"{db_name}.db"
+
+    @classmethod
+    def remove_files(cls, db_name: str) -> None:
+        """Delete `data/<db_name>.db` including its WAL files and archives"""
+        path = cls.path_of(db_name)
+        for suffix in ("", "-wal", "-shm"):
+            path.with_name(path.name + suffix).unlink(missing_ok=True)
+        for archive in (path.parent / "archive").glob(f"{path.stem}-????-??.db*"):
+            archive.unlink()
 
     def __enter__(self) -> "Database":
         return self
@@ -31,81 +187,716 @@ class Database:
         self.close()
 
     def close(self):
+        if self.write_behind and self.__writer is not None and self.__writer.is_alive():
+            self.__queue.put(None)  # stop signal, pending rows are written first
+            self.__writer.join()
+        self.__closed = True
+        while not self.__readers.empty():
+            self.__readers.get_nowait().close()
         try:
             self.con.close()
         except AttributeError:
             print("Not closable.")
             return True  # exception handled successfully
+        # rows the writer could not write before stopping are lost
+        self.__raise_write_error()
 
     def __connect(self) -> None:
+        # the writer connection is shared by all threads, always under the lock
         self.con = sqlite3.connect(self.path_db,
                                    detect_types=sqlite3.PARSE_DECLTYPES |
-                                   sqlite3.PARSE_COLNAMES)
+                                   sqlite3.PARSE_COLNAMES,
+                                   check_same_thread=False)
         self.cur = self.con.cursor()
+        if self.path_db != ":memory:":
+            # readers do not block the writer and commits skip most fsyncs
+            self.cur.execute("PRAGMA journal_mode=WAL;")
+            self.cur.execute("PRAGMA synchronous=NORMAL;")
+
+    @contextlib.contextmanager
+    def __reader(self) -> Iterator[Tuple[sqlite3.Connection, contextlib.AbstractContextManager]]:
+        """(connection, lock) for a read: a pooled read-only connection that
+        needs no locking, or the locked writer connection for :memory:
+
+        A new connection is opened if none is idle, so nested or concurrent
+        reads never wait for each other.
+        """
+        if self.path_db == ":memory:":
+            yield self.con, self.__lock
+            return
+        try:
+            con = self.__readers.get_nowait()
+        except queue.Empty:
+            # WAL: every statement reads the last committed snapshot
+            con = sqlite3.connect(f"{Path(self.path_db).as_uri()}?mode=ro", uri=True,
+                                  detect_types=sqlite3.PARSE_DECLTYPES |
+                                  sqlite3.PARSE_COLNAMES,
+                                  check_same_thread=False)
+        try:
+            yield con, contextlib.nullcontext()
+        finally:
+            if self.__closed or self.__readers.qsize() >= self.read_connections:
+                con.close()
+            else:
+                self.__readers.put(con)
 
     def __create_table(self) -> None:
-        create_table_query = """
-            CREATE TABLE IF NOT EXISTS dates (
-                time timestamp,
-                date date,
-                real_day TEXT,
-                guessed_day TEXT,
-                correct NULL);
+        version = self.cur.execute("PRAGMA user_version;").fetchone()[0]
+        has_dates = self.cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'dates';").fetchone()
+        if version == 0 and has_dates:
+            version = 1  # created before the schema was versioned
+        if has_dates:
+            self.__migrate(version)
+        else:
+            self.__execute(self.create_table_query.format(schema=""))
+            self.__execute(f"PRAGMA user_version = {SCHEMA_VERSION};")
+        self.__create_indexes()
+        self.__create_daily_summary()
+
+    def __create_indexes(self) -> None:
+        if not self.multi_user:
+            # local databases from before the user index was multi-user only
+            for name in self.user_indexes:
+                self.__execute(f"DROP INDEX IF EXISTS {name};")
+        for create_index_query in self.indexes.values():
+            self.__execute(create_index_query)
+
+    def __migrate(self, version: int) -> None:
+        """Upgrade an existing database in place to SCHEMA_VERSION"""
+        migrations = {1: self.__migrate_v1_to_v2, 2: self.__migrate_v2_to_v3,
+                      3: self.__migrate_v3_to_v4}
+        migrated = version < SCHEMA_VERSION
+        while version < SCHEMA_VERSION:
+            # every step and its version bump form one transaction
+            script = migrations[version]()
+            version += 1
+            with self.__lock:
+                self.cur.executescript(
+                    f"BEGIN; {script} PRAGMA user_version = {version}; COMMIT;")
+        if migrated and self.path_db != ":memory:":
+            self.cur.execute("VACUUM;")
+
+    def __migrate_v1_to_v2(self) -> str:
+        """TEXT weekdays and converted timestamps/dates -> integers"""
+        weekday_case = "CASE lower({}) " + " ".join(
+            f"WHEN '{day.lower()}' THEN {idx}" for idx, day in enumerate(WEEKDAYS)) + " END"
+        return f"""
+            CREATE TABLE dates_v2 (
+                time INTEGER,
+                date INTEGER,
+                real_day INTEGER,
+                guessed_day INTEGER,
+                correct INTEGER);
+            INSERT INTO dates_v2 (rowid, time, date, real_day, guessed_day, correct)
+                SELECT rowid,
+                       -- floored to ms like `encode_time`: whole seconds plus the
+                       -- first 3 digits of the fraction ('YYYY-MM-DD HH:MM:SS.ffffff')
+                       CAST(strftime('%s', substr(time, 1, 19)) AS INTEGER) * 1000
+                           + CAST(substr(time || '000', 21, 3) AS INTEGER),
+                       CAST(julianday(date) - 1721424.5 AS INTEGER),
+                       {weekday_case.format("real_day")},
+                       {weekday_case.format("guessed_day")},
+                       correct != 0
+                FROM dates;
+            DROP TABLE dates;
+            ALTER TABLE dates_v2 RENAME TO dates;
+            DROP TABLE IF EXISTS daily_summary;
             """
-        self.__execute(create_table_query)
 
-    def __execute(self, query: str, parms: Iterable = ()) -> None:
-        with self.con:
-            return self.cur.execute(query, parms)
+    def __migrate_v2_to_v3(self) -> str:
+        """Per user attempts (NULL for the local app)"""
+        return "ALTER TABLE dates ADD COLUMN user TEXT;"
 
-    def insert(self, date: datetime.date, real_day: str, guessed_day: str) -> None:
-        insert_data = """
-            INSERT INTO dates
-                VALUES (:time, :date, :real_day, :guessed_day, :correct);
+    def __migrate_v3_to_v4(self) -> str:
+        """Derived date columns for the accuracy indexes"""
+        return """
+            ALTER TABLE dates ADD COLUMN year INTEGER;
+            ALTER TABLE dates ADD COLUMN leap INTEGER;
+            ALTER TABLE dates ADD COLUMN doy INTEGER;
+            UPDATE dates SET
+                year = CAST(strftime('%Y', date + 1721424.5) AS INTEGER),
+                doy = CAST(strftime('%j', date + 1721424.5) AS INTEGER) - 1;
+            UPDATE dates SET leap = (year % 4 = 0 AND year % 100 != 0) OR year % 400 = 0;
             """
-        current_time = datetime.datetime.now()
-        correct = real_day == guessed_day
-        data_tuple = (current_time, date, real_day, guessed_day, correct)
-        self.__execute(insert_data, data_tuple)
+
+    def __create_daily_summary(self) -> None:
+        """Rollups of `dates` kept up to date by triggers: per day of the
+        attempt (`daily_summary`) and per century, leap and day of the year
+        of the asked date (`date_summary`)"""
+        summaries_exist = self.cur.execute(
+            "SELECT COUNT(*) FROM sqlite_master "
+            "WHERE name IN ('daily_summary', 'date_summary');").fetchone()[0] == 2
+        create_summary_query = """
+            CREATE TABLE IF NOT EXISTS daily_summary (
+                day INTEGER PRIMARY KEY,
+                n_correct INTEGER NOT NULL DEFAULT 0,
+                n_wrong INTEGER NOT NULL DEFAULT 0);
+            CREATE TABLE IF NOT EXISTS date_summary (
+                century INTEGER,
+                leap INTEGER,
+                doy INTEGER,
+                n_correct INTEGER NOT NULL DEFAULT 0,
+                n_wrong INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (century, leap, doy)) WITHOUT ROWID;
+            """
+        with self.__lock:
+            self.cur.executescript(create_summary_query)
+            if not summaries_exist:
+                # databases from before the rollups existed: the old triggers
+                # only fill `daily_summary`
+                self.cur.execute("DROP TRIGGER IF EXISTS daily_summary_insert;")
+                self.cur.execute("DROP TRIGGER IF EXISTS daily_summary_delete;")
+        self.__create_summary_triggers()
+        if not summaries_exist:
+            self.rebuild_daily_summary()
+
+    def __create_summary_triggers(self) -> None:
+        insert_trigger_query = f"""
+            CREATE TRIGGER IF NOT EXISTS daily_summary_insert
+            AFTER INSERT ON dates BEGIN
+                INSERT INTO daily_summary (day, n_correct, n_wrong)
+                    VALUES (NEW.time / {MS_PER_DAY} + {EPOCH_ORDINAL},
+                            NEW.correct != 0, NEW.correct = 0)
+                    ON CONFLICT(day) DO UPDATE SET
+                        n_correct = n_correct + excluded.n_correct,
+                        n_wrong = n_wrong + excluded.n_wrong;
+                INSERT INTO date_summary (century, leap, doy, n_correct, n_wrong)
+                    VALUES (NEW.year / 100, NEW.leap, NEW.doy,
+                            NEW.correct != 0, NEW.correct = 0)
+                    ON CONFLICT(century, leap, doy) DO UPDATE SET
+                        n_correct = n_correct + excluded.n_correct,
+                        n_wrong = n_wrong + excluded.n_wrong;
+            END;
+            """
+        delete_trigger_query = f"""
+            CREATE TRIGGER IF NOT EXISTS daily_summary_delete
+            AFTER DELETE ON dates BEGIN
+                UPDATE daily_summary SET
+                    n_correct = n_correct - (OLD.correct != 0),
+                    n_wrong = n_wrong - (OLD.correct = 0)
+                    WHERE day = OLD.time / {MS_PER_DAY} + {EPOCH_ORDINAL};
+                DELETE FROM daily_summary
+                    WHERE day = OLD.time / {MS_PER_DAY} + {EPOCH_ORDINAL}
+                        AND n_correct + n_wrong = 0;
+                UPDATE date_summary SET
+                    n_correct = n_correct - (OLD.correct != 0),
+                    n_wrong = n_wrong - (OLD.correct = 0)
+                    WHERE century = OLD.year / 100 AND leap = OLD.leap AND doy = OLD.doy;
+                DELETE FROM date_summary
+                    WHERE century = OLD.year / 100 AND leap = OLD.leap AND doy = OLD.doy
+                        AND n_correct + n_wrong = 0;
+            END;
+            """
+        # plain cursor: stays inside the transaction of bulk_import/archive
+        with self.__lock:
+            self.cur.execute(insert_trigger_query)
+            self.cur.execute(delete_trigger_query)
+
+    def rebuild_daily_summary(self) -> None:
+        """Recompute `daily_summary` and `date_summary` from all rows of
+        `dates` and its archives"""
+        self.flush()
+        with self.__lock:
+            with self.con:
+                self.__rebuild_daily_summary()
+            for month in self.archive_months():
+                alias = self.__attach(month)
+                try:
+                    with self.con:
+                        self.__add_to_daily_summary(f"{alias}.dates")
+                finally:
+                    self.cur.execute(f"DETACH DATABASE {alias};")
+
+    def __rebuild_daily_summary(self) -> None:
+        self.cur.execute("DELETE FROM daily_summary;")
+        self.cur.execute("DELETE FROM date_summary;")
+        self.__add_to_daily_summary()
+
+    def __add_to_daily_summary(self, table: str = "main.dates", min_rowid: int = 0) -> None:
+        """Add the rows of `table` after `min_rowid` to the rollups"""
+        self.cur.execute(f"""
+            INSERT INTO daily_summary (day, n_correct, n_wrong)
+                SELECT time / {MS_PER_DAY} + {EPOCH_ORDINAL}, SUM(correct != 0), SUM(correct = 0)
+                FROM {table} WHERE rowid > ? GROUP BY 1
+                ON CONFLICT(day) DO UPDATE SET
+                    n_correct = n_correct + excluded.n_correct,
+                    n_wrong = n_wrong + excluded.n_wrong;
+            """, (min_rowid,))
+        self.cur.execute(f"""
+            INSERT INTO date_summary (century, leap, doy, n_correct, n_wrong)
+                SELECT year / 100, leap, doy, SUM(correct != 0), SUM(correct = 0)
+                FROM {table} WHERE rowid > ? GROUP BY 1, 2, 3
+                ON CONFLICT(century, leap, doy) DO UPDATE SET
+                    n_correct = n_correct + excluded.n_correct,
+                    n_wrong = n_wrong + excluded.n_wrong;
+            """, (min_rowid,))
+
+    def __execute(self, query: str, parms: Iterable = ()) -> sqlite3.Cursor:
+        if instrumentation.ENABLED:
+            start = time.perf_counter()
+        with self.__lock, self.con:
+            cur = self.con.execute(query, parms)
+        if instrumentation.ENABLED:
+            kind = query.split(None, 1)[0].upper()
+            instrumentation.record(f"Database.execute.{kind}", time.perf_counter() - start)
+        return cur
+
+    def __executemany(self, query: str, rows: List[tuple]) -> None:
+        if instrumentation.ENABLED:
+            start = time.perf_counter()
+        with self.__lock, self.con:
+            self.con.executemany(query, rows)
+            self.__last_rowid = self.con.execute(
+                "SELECT last_insert_rowid();").fetchone()[0]
+        if instrumentation.ENABLED:
+            instrumentation.record("Database.executemany", time.perf_counter() - start)
+
+    def __write_loop(self) -> None:
+        """Drain the insert queue in batches (runs in the writer thread)
+
+        Never dies on a failed write: the batch is retried `write_retries`
+        times, then kept for the next batch while the error is raised by
+        `insert`, `flush` and `close`.
+        """
+        rows = []
+        stop = False
+        while not stop:
+            n_new = 0
+            flushed = None
+            deadline = time.monotonic() + self.flush_interval
+            while n_new < self.batch_size:
+                try:
+                    row = self.__queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if row is None or isinstance(row, threading.Event):
+                    # stop signal or flush marker: write what came before it now
+                    stop = row is None
+                    flushed = row
+                    self.__queue.task_done()
+                    break
+                rows.append(row)
+                n_new += 1
+            try:
+                for attempt in range(self.write_retries + 1):
+                    if not rows:
+                        break
+                    try:
+                        self.__executemany(self.insert_query, rows)
+                        rows = []
+                        self.__write_error = None
+                    except Exception as err:
+                        self.__write_error = err
+                        if attempt < self.write_retries:
+                            time.sleep(self.retry_delay * 2 ** attempt)
+            finally:
+                for _ in range(n_new):
+                    self.__queue.task_done()
+                if flushed is not None:
+                    flushed.set()
+
+    def __raise_write_error(self) -> None:
+        if self.__write_error is not None:
+            raise self.__write_error
+
+    def flush(self) -> None:
+        """Block until all queued inserts are written, raise if that failed"""
+        if self.write_behind and self.__writer is not None and self.__writer.is_alive():
+            # wait for the rows queued so far only, not for an idle queue
+            flushed = threading.Event()
+            self.__queue.put(flushed)
+            flushed.wait()
+        self.__raise_write_error()
+
+    def insert(self, date: datetime.date, real_day: str, guessed_day: str,
+               user: str = None) -> None:
+        current_time = encode_time(datetime.datetime.now())
+        real_day, guessed_day = encode_weekday(real_day), encode_weekday(guessed_day)
+        correct = int(real_day == guessed_day)
+        data_tuple = (current_time, date.toordinal(), real_day, guessed_day, correct, user,
+                      *encode_date(date))
+        if self.write_behind:
+            # the writer keeps failing: do not queue more rows silently
+            self.__raise_write_error()
+            self.__queue.put(data_tuple)
+        else:
+            # the cursor of this call, no other statement can change its lastrowid
+            self.__last_rowid = self.__execute(self.insert_query, data_tuple).lastrowid
+
+    def insert_many(self, rows: Iterable[tuple]) -> None:
+        """Insert complete rows (time, date, real_day, guessed_day, correct)
+        in one transaction; weekdays may be names or ints"""
+        self.flush()
+        self.__executemany(self.insert_query, [encode_row(row) for row in rows])
+
+    def bulk_import(self, rows: Iterable[tuple], chunk_size: int = 50_000) -> int:
+        """Insert many (time, date, real_day, guessed_day, correct[, user]) rows
+        in a single transaction
+
+        The rollup triggers and secondary indexes are dropped for the import;
+        the imported rows are added to the rollup and the indexes are rebuilt
+        once at the end. Returns the number of imported rows.
+        """
+        self.flush()
+        n_rows = 0
+        with self.__lock:
+            try:
+                self.cur.execute("BEGIN;")
+                max_rowid = self.cur.execute(
+                    "SELECT IFNULL(MAX(rowid), 0) FROM dates;").fetchone()[0]
+                self.cur.execute("DROP TRIGGER IF EXISTS daily_summary_insert;")
+                self.cur.execute("DROP TRIGGER IF EXISTS daily_summary_delete;")
+                for name in self.indexes:
+                    self.cur.execute(f"DROP INDEX IF EXISTS {name};")
+                rows = iter(rows)
+                while True:
+                    chunk = [encode_row(row) for row in islice(rows, chunk_size)]
+                    if not chunk:
+                        break
+                    self.cur.executemany(self.insert_query, chunk)
+                    n_rows += len(chunk)
+                self.__add_to_daily_summary(min_rowid=max_rowid)
+                self.__create_summary_triggers()
+                for create_index_query in self.indexes.values():
+                    self.cur.execute(create_index_query)
+                self.con.commit()
+            except BaseException:
+                self.con.rollback()
+                raise
+        return n_rows
+
+    def archive_path(self, month: str) -> Path:
+        """`data/archive/<db_name>-<YYYY-MM>.db`"""
+        if self.path_db == ":memory:":
+            raise ValueError("in-memory databases have no archives")
+        path = Path(self.path_db)
+        return path.parent / "archive" / f"{path.stem}-{month}.db"
+
+    def archive_months(self) -> List[str]:
+        """Months (YYYY-MM) with an archive file, oldest first"""
+        if self.path_db == ":memory:":
+            return []
+        if self.__archive_months is None:
+            path = Path(self.path_db)
+            self.__archive_months = sorted(
+                archive.stem[len(path.stem) + 1:] for archive in
+                (path.parent / "archive").glob(f"{path.stem}-????-??.db"))
+        return list(self.__archive_months)
+
+    @staticmethod
+    def __month_range(month: str) -> Tuple[int, int]:
+        """[start, end) of a month (YYYY-MM) in epoch ms"""
+        year, month = map(int, month.split("-"))
+        end = datetime.datetime(year + month // 12, month % 12 + 1, 1)
+        return encode_time(datetime.datetime(year, month, 1)), encode_time(end)
+
+    def __attach(self, month: str, con: sqlite3.Connection = None) -> str:
+        """Attach the archive of `month` to the writer, or read-only to `con`"""
+        alias = f"archive_{month.replace('-', '_')}"
+        if con is None:
+            self.cur.execute(f"ATTACH DATABASE ? AS {alias};", (str(self.archive_path(month)),))
+        else:
+            con.execute(f"ATTACH DATABASE ? AS {alias};",
+                        (f"{self.archive_path(month).as_uri()}?mode=ro",))
+        return alias
+
+    def archive(self, older_than: datetime.timedelta = None, vacuum: bool = True,
+                min_rows: int = 0) -> int:
+        """Move attempts older than `older_than` (default: `archive_after_days`)
+        into one archive file per month
+
+        The rollups keep the archived attempts, so the progress chart and the
+        scheduler's warm start still see the whole history; the accuracy
+        statistics only count the hot database. Every month is moved in one transaction; with WAL a crash
+        during the commit may leave a month in both files. Nothing is moved
+        (and nothing vacuumed) while fewer than `min_rows` attempts are due.
+        Returns the number of moved rows.
+        """
+        if older_than is None:
+            older_than = datetime.timedelta(days=self.archive_after_days)
+        cutoff = encode_time(datetime.datetime.now() - older_than)
+        if min_rows > 0:
+            # stops counting at `min_rows` on the time index
+            n_due = self.get_data("SELECT COUNT(*) FROM (SELECT 1 FROM dates "
+                                  "WHERE time < ? LIMIT ?);", (cutoff, min_rows))[0][0]
+            if n_due < min_rows:
+                return 0
+        months = [month for month, in self.get_data(
+            "SELECT DISTINCT strftime('%Y-%m', time / 1000, 'unixepoch') FROM dates "
+            "WHERE time < ? ORDER BY 1;", (cutoff,))]
+        n_rows = 0
+        with self.__lock:
+            for month in months:
+                start, end = self.__month_range(month)
+                self.archive_path(month).parent.mkdir(exist_ok=True)
+                alias = self.__attach(month)
+                try:
+                    self.cur.execute("BEGIN;")
+                    self.cur.execute(self.create_table_query.format(schema=f"{alias}."))
+                    # archived rows stay counted in the rollups
+                    self.cur.execute("DROP TRIGGER IF EXISTS daily_summary_delete;")
+                    self.cur.execute(f"""
+                        INSERT INTO {alias}.dates ({COLUMNS}, year, leap, doy)
+                            SELECT {COLUMNS}, year, leap, doy FROM main.dates
+                            WHERE time >= ? AND time < ? ORDER BY rowid;
+                        """, (start, min(end, cutoff)))
+                    self.cur.execute("DELETE FROM main.dates WHERE time >= ? AND time < ?;",
+                                     (start, min(end, cutoff)))
+                    n_rows += self.cur.rowcount
+                    self.__create_summary_triggers()
+                    self.con.commit()
+                    if month not in self.archive_months():
+                        bisect.insort(self.__archive_months, month)
+                except BaseException:
+                    self.con.rollback()
+                    raise
+                finally:
+                    self.cur.execute(f"DETACH DATABASE {alias};")
+            if n_rows and vacuum and self.path_db != ":memory:":
+                self.cur.execute("VACUUM;")
+                # with WAL the file only shrinks at the checkpoint
+                self.cur.execute("PRAGMA wal_checkpoint(TRUNCATE);").fetchall()
+        return n_rows
+
+    def __iter_segment(self, months: List[str], low: int, high: int,
+                       size: int) -> Iterator[tuple]:
+        """Rows of main and the archives of `months` with low <= time < high"""
+        with self.__reader() as (con, lock):
+            with lock:
+                aliases = [self.__attach(month, con) for month in months]
+            querry = " UNION ALL ".join(
+                f"SELECT rowid, {COLUMNS} FROM {schema}.dates WHERE time >= :low AND time < :high"
+                for schema in aliases + ["main"]) + " ORDER BY time;"
+            recs = self.__fetch_pages(con, lock, querry, {"low": low, "high": high}, size)
+            try:
+                yield from recs
+            finally:
+                recs.close()  # an open cursor would block the DETACH
+                with lock:
+                    for alias in aliases:
+                        con.execute(f"DETACH DATABASE {alias};")
+
+    def iter_range(self, start: datetime.datetime, end: datetime.datetime,
+                   decode: bool = False, size: int = 1_000) -> Iterator[tuple]:
+        """Attempts with start <= time < end in time order
+
+        Only the archives of months overlapping the range are attached, at
+        most `max_attached` at a time: the range is read in consecutive
+        segments. rowids are per file.
+        """
+        low, high = encode_time(start), encode_time(end)
+        self.flush()
+        # the time column and the archive files share the local month
+        months = self.archive_months()
+        months = months[bisect.bisect_left(months, f"{start.year:04d}-{start.month:02d}"):
+                        bisect.bisect_right(months, f"{end.year:04d}-{end.month:02d}")]
+        segments = []
+        for idx in range(0, len(months), self.max_attached):
+            batch = months[idx:idx + self.max_attached]
+            segment_high = min(self.__month_range(batch[-1])[1], high)
+            segments.append((batch, low, segment_high))
+            low = segment_high
+        if low < high or not segments:
+            segments.append(([], low, high))
+        for batch, segment_low, segment_high in segments:
+            recs = self.__iter_segment(batch, segment_low, segment_high, size)
+            yield from map(decode_row, recs) if decode else recs
 
     def is_not_empty(self, table: str = "dates"):
-        querry = "SELECT EXISTS(SELECT 1 FROM dates LIMIT 1);"
-        self.__execute(querry)  # , (table,))
-        return self.cur.fetchone()[0]
+        return self.get_data("SELECT EXISTS(SELECT 1 FROM dates LIMIT 1);")[0][0]
 
-    def get_data(self, querry: str) -> List[tuple]:
-        self.__execute(querry)
-        recs = self.cur.fetchall()
+    def get_data(self, querry: str, parms: Iterable = ()) -> List[tuple]:
+        """All rows of a read-only `querry`, run on a connection of its own"""
+        self.flush()
+        if instrumentation.ENABLED:
+            start = time.perf_counter()
+        with self.__reader() as (con, lock), lock:
+            recs = con.execute(querry, parms).fetchall()
+        if instrumentation.ENABLED:
+            kind = querry.split(None, 1)[0].upper()
+            instrumentation.record(f"Database.execute.{kind}", time.perf_counter() - start)
         return recs
 
-    def get_all_data(self) -> List[tuple]:
-        self.cur.execute("SELECT rowid, * FROM dates")
-        recs = self.cur.fetchall()
+    @staticmethod
+    def __fetch_pages(con: sqlite3.Connection, lock: contextlib.AbstractContextManager,
+                      querry: str, parms: Iterable, size: int) -> Iterator[tuple]:
+        with lock:
+            cur = con.execute(querry, parms)
+        try:
+            while True:
+                with lock:
+                    recs = cur.fetchmany(size)
+                if not recs:
+                    return
+                yield from recs
+        finally:
+            cur.close()
+
+    def iter_data(self, querry: str, parms: Iterable = (),
+                  size: int = 1_000) -> Iterator[tuple]:
+        """Stream the result of `querry`, `size` rows at a time
+
+        Holds a read-only connection until the iteration ends, so all pages
+        come from one snapshot while inserts go on.
+        """
+        self.flush()
+        with self.__reader() as (con, lock):
+            yield from self.__fetch_pages(con, lock, querry, parms, size)
+
+    def iter_all_data(self, decode: bool = False, size: int = 1_000) -> Iterator[tuple]:
+        """Like `get_all_data` in constant memory"""
+        recs = self.iter_data(f"SELECT rowid, {COLUMNS} FROM dates", size=size)
+        if decode:
+            return map(decode_row, recs)
+        return recs
+
+    def get_all_data(self, decode: bool = False) -> List[tuple]:
+        """All rows of the hot database as stored (integers), or as Python
+        objects with `decode`; see `iter_range` for the archived rows
+        """
+        recs = self.get_data(f"SELECT rowid, {COLUMNS} FROM dates")
+        if decode:
+            recs = [decode_row(rec) for rec in recs]
         return recs
 
-    def get_last_inserted_rec(self) -> tuple:
-        rowid = self.cur.lastrowid
-        query = "SELECT rowid, * FROM dates WHERE rowid = (?)"
-        self.__execute(query, (str(rowid),))
-        rec = self.cur.fetchone()
+    def get_last_inserted_rec(self, decode: bool = False) -> tuple:
+        """The row of the last `insert`/`insert_many` of this `Database`"""
+        self.flush()
+        recs = self.get_data(f"SELECT rowid, {COLUMNS} FROM dates WHERE rowid = ?",
+                             (self.__last_rowid,))
+        rec = recs[0] if recs else None
+        if decode and rec is not None:
+            rec = decode_row(rec)
         return rec
 
+    def get_user_stats(self, user: str = None) -> Tuple[int, int]:
+        """(attempts, correct answers) of one user (None: the local app)"""
+        return self.get_data(
+            "SELECT COUNT(*), IFNULL(SUM(correct), 0) FROM dates WHERE user IS ?;",
+            (user,))[0]
+
+    def get_accuracy(self, by: str) -> List[Tuple[int, int, int]]:
+        """(category, attempts, correct answers) sorted by category
+
+        `by` is one of ACCURACY_CATEGORIES: century (year // 100), month (1-12),
+        weekday (0 = Sunday), leap (0/1) or distance (index into
+        `anchors.DISTANCE_BUCKETS`). Every query is a GROUP BY over a covering
+        index; century, month and distance are rolled up from at most one
+        group per year or per day of the year. Attempts moved to the monthly
+        archives by `archive()` are not counted.
+        """
+        if by == "weekday":
+            return self.get_data(
+                "SELECT real_day, COUNT(*), SUM(correct) FROM dates GROUP BY real_day;")
+        if by == "leap":
+            return self.get_data(
+                "SELECT leap, COUNT(*), SUM(correct) FROM dates GROUP BY leap;")
+        if by == "century":
+            groups = ((year // 100, attempts, correct) for year, attempts, correct in self.get_data(
+                "SELECT year, COUNT(*), SUM(correct) FROM dates GROUP BY year;"))
+        elif by in ("month", "distance"):
+            recs = self.get_data(
+                "SELECT leap, doy, COUNT(*), SUM(correct) FROM dates GROUP BY leap, doy;")
+            if by == "month":
+                groups = ((bisect.bisect_right(anchors.MONTH_STARTS[leap], doy), attempts, correct)
+                          for leap, doy, attempts, correct in recs)
+            else:
+                groups = ((anchors.distance_bucket(anchors.ANCHOR_INDEX[leap][doy][1]),
+                           attempts, correct)
+                          for leap, doy, attempts, correct in recs)
+        else:
+            raise ValueError(f"'by' has to be one of {ACCURACY_CATEGORIES}, not '{by}'")
+        totals = {}
+        for category, attempts, correct in groups:
+            n_attempts, n_correct = totals.get(category, (0, 0))
+            totals[category] = (n_attempts + attempts, n_correct + correct)
+        return [(category, *totals[category]) for category in sorted(totals)]
+
+    def get_daily_summary(self) -> List[tuple]:
+        """(day, n_correct, n_wrong) for every day with attempts"""
+        summary = self.get_data(
+            "SELECT day, n_correct, n_wrong FROM daily_summary ORDER BY day")
+        return [(datetime.date.fromordinal(day), n_correct, n_wrong)
+                for day, n_correct, n_wrong in summary]
+
+    def get_date_summary(self) -> List[Tuple[int, int, int, int, int]]:
+        """(century, leap, doy, n_correct, n_wrong) of the asked dates, archives included"""
+        return self.get_data(
+            "SELECT century, leap, doy, n_correct, n_wrong FROM date_summary;")
+
+    def get_data_version(self) -> Tuple[int, int]:
+        """(max rowid, number of rows) of `dates`, changes with every insert/delete
+
+        The row count comes from the rollup, so this does not scan `dates`.
+        """
+        return self.get_data("""
+            SELECT (SELECT IFNULL(MAX(rowid), 0) FROM dates),
+                   (SELECT IFNULL(SUM(n_correct + n_wrong), 0) FROM daily_summary);
+            """)[0]
+
+    def save_metrics(self, rows: Iterable[tuple]) -> None:
+        """Store (name, count, mean, p50, p95, p99) timing summaries in `metrics`"""
+        create_table_query = """
+            CREATE TABLE IF NOT EXISTS metrics (
+                time timestamp,
+                name TEXT,
+                count INTEGER,
+                mean_ms REAL,
+                p50_ms REAL,
+                p95_ms REAL,
+                p99_ms REAL);
+            """
+        self.flush()
+        self.__execute(create_table_query)
+        current_time = datetime.datetime.now()
+        with self.__lock, self.con:
+            self.cur.executemany("INSERT INTO metrics VALUES (?, ?, ?, ?, ?, ?, ?);",
+                                 [(current_time, *row) for row in rows])
+
     def delete_row(self, rowid: int) -> None:
+        self.flush()
         query = "DELETE from dates WHERE rowid = (?)"
-        self.__execute(query, str(rowid))
+        self.__execute(query, (rowid,))
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Database maintenance")
+    parser.add_argument("--rebuild", metavar="DB_NAME",
+                        help="recompute the rollups of data/<DB_NAME>.db")
+    parser.add_argument("--accuracy", metavar="DB_NAME",
+                        help="print the accuracy per category of data/<DB_NAME>.db")
+    parser.add_argument("--archive", metavar="DB_NAME",
+                        help="move old attempts of data/<DB_NAME>.db to data/archive/")
+    parser.add_argument("--older-than-days", type=int, default=Database.archive_after_days)
+    args = parser.parse_args()
+    if args.archive is not None:
+        with Database(args.archive) as db:
+            n_rows = db.archive(datetime.timedelta(days=args.older_than_days))
+            print(f"archived {n_rows:,} rows, archives: {', '.join(db.archive_months())}")
+        return
+    if args.rebuild is not None:
+        with Database(args.rebuild) as db:
+            db.rebuild_daily_summary()
+        return
+    if args.accuracy is not None:
+        with Database(args.accuracy) as db:
+            for by in ACCURACY_CATEGORIES:
+                print(by)
+                for category, attempts, correct in db.get_accuracy(by):
+                    print(f"  {category:>4}{attempts:>10}{correct / attempts:>8.1%}")
+        return
+
     with Database() as db:
         db.is_not_empty()
         db.insert(datetime.date(1994, 7, 30), "saturday", "saturday")
         db.is_not_empty()
         db.insert(datetime.date(1994, 7, 30), "saturday", "friday")
         db.insert(datetime.date(1994, 7, 30), "saturday", "monday")
-        rec = db.get_last_inserted_rec()
+        rec = db.get_last_inserted_rec(decode=True)
         print(rec)
         # db.delete_row(2)
-        recs = db.get_all_data()
+        recs = db.get_all_data(decode=True)
     for rec in recs:
         print(rec)
 
@@ -0,0 +1,186 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:20:49
+Description: Headless doomsday algorithm and structured explanations
+
+@author: tsenoner
+"""
+import datetime
+import functools
+import json
+import random
+from dataclasses import asdict, dataclass
+from typing import List, Optional, Tuple
+
+import anchors
+
+YEAR_CACHE_SIZE = 1024
+EXPLANATION_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=YEAR_CACHE_SIZE)
+def year_variables(year: int) -> Tuple[int, int, int, int, int, int, int]:
+    """Doomsday variables of a year, shared by all dates of that year"""
+    return anchors.doomsday_variables(year)
+
+
+@dataclass(frozen=True)
+class Step:
+    title: str
+    lines: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class Explanation:
+    """All values of the doomsday calculation of one date"""
+    date:             datetime.date
+    nice_date:        str
+    nice_md:          str
+    year:             int
+    century_doomsday: int
+    abbr_year:        int
+    b:                int
+    c:                int
+    d:                int
+    e:                int
+    year_doomsday:    int
+    closest_doomsday: str
+    diff:             int
+    weekday_int:      int
+    weekday:          str
+    weekday_doom:     str
+
+    @property
+    def title(self) -> str:
+        return f"Explaination for {self.nice_date}"
+
+    @property
+    def steps(self) -> List[Step]:
+        tmp_sum = self.year_doomsday + self.diff
+        return [
+            Step(f"Doomsday for the year {self.year}:", (
+                f"- a = century doomsdays  = {self.century_doomsday}",
+                f"- b = {self.abbr_year:02d} divisable by 12 = {self.b}",
+                f"- c = {self.abbr_year:02d} modulo 12       = {self.c}",
+                f"- d = c divisable by 4   = {self.d}",
+                f"- e = a + b + c + d      = {self.e}",
+                f"- doomsday = e modulo 7  = {self.year_doomsday}",
+            )),
+            Step("Difference to nearest doomsdays:", (
+                f"- {self.nice_md} - {self.closest_doomsday} = {self.diff}",
+            )),
+            Step(f"Weekday of {self.nice_date}:", (
+                f"- {self.year_doomsday}{self.diff:+} = {tmp_sum}",
+                f"- {tmp_sum} modulo 7 = {self.weekday_int}",
+                f"- {self.weekday_int} = {self.weekday_doom} = {self.weekday} ",
+            )),
+        ]
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["date"] = self.date.isoformat()
+        data["steps"] = [asdict(step) for step in self.steps]
+        return data
+
+
+class Doomsday:
+    weekdays:          List[str] = ["Sunday", "Monday", "Tuesday", "Wednesday",
+                                    "Thursday", "Friday", "Saturday"]
+    doomsday_weekdays: List[str] = ["Nonday", "Oneday", "Twosday", "Threesday",
+                                    "Foursday", "Fiveday", "Sixturday"]
+    date:      datetime.date
+    nice_date: str
+    nice_md:   str
+    year:      int
+    doomsdays: List[str]
+
+    def __init__(self, date) -> None:
+        self.date = date
+        self.nice_date = f"{date.day:02d}-{date.month:02d}-{date.year}"
+        self.nice_md = f"{date.day:02d}/{date.month:02d}"
+        self.year = date.year
+        self.get_doomsdays()
+
+    def get_doomsdays(self) -> None:
+        self.doomsdays = list(anchors.DOOMSDAY_LABELS[anchors.is_leap(self.year)])
+
+    def get_doomsday_variables(self) -> Tuple[int, int, int, int, int, int, int]:
+        """Get all variables to calculate the doomsday of the given year
+        """
+        return year_variables(self.year)
+
+    def get_closest_domesday(self) -> Tuple[str, int]:
+        return anchors.closest_doomsday(self.year, self.date.month, self.date.day)
+
+    def get_weekday(self) -> Tuple[int, str, str]:
+        *_, year_doomsday = self.get_doomsday_variables()
+        _, diff = self.get_closest_domesday()
+        weekday_int = (year_doomsday + diff) % 7
+        return weekday_int, self.weekdays[weekday_int], self.doomsday_weekdays[weekday_int]
+
+    def explain(self) -> Explanation:
+        variables = self.get_doomsday_variables()
+        closest_doomsday, diff = self.get_closest_domesday()
+        weekday_int = (variables[-1] + diff) % 7
+        return Explanation(self.date, self.nice_date, self.nice_md, self.year,
+                           *variables, closest_doomsday, diff, weekday_int,
+                           self.weekdays[weekday_int], self.doomsday_weekdays[weekday_int])
+
+
+@functools.lru_cache(maxsize=EXPLANATION_CACHE_SIZE)
+def explain_date(date: datetime.date) -> Explanation:
+    """Memoized `Doomsday(date).explain()` (explanations are immutable)"""
+    return Doomsday(date).explain()
+
+
+def cache_info() -> dict:
+    """Hit/miss counters of the year and explanation caches"""
+    return {"years": year_variables.cache_info(),
+            "explanations": explain_date.cache_info()}
+
+
+def random_date(start_year: int = 1500, end_year: int = 2500,
+                rng: random.Random = None) -> datetime.date:
+    assert end_year >= start_year, "'end_year' has to be larger than 'start_year'"
+    min_date = datetime.date(start_year, 1, 1)
+    max_date = datetime.date(end_year, 12, 31)
+    delta = max_date - min_date
+    int_delta = (delta.days)
+    random_day = (rng or random).randrange(int_delta)
+    return min_date + datetime.timedelta(days=random_day)
+
+
+def parse_weekday(text: str) -> Optional[int]:
+    """Weekday number (0 = Sunday) of an answer: 0-6, full name or three letters"""
+    text = text.strip()
+    # check if entered text is numeric
+    if text.isnumeric():
+        day = int(text)
+        return day if 0 <= day <= 6 else None
+    # else check if it matches a weekday (full name or three letters)
+    entry = text.capitalize()
+    if entry in Doomsday.weekdays:
+        return Doomsday.weekdays.index(entry)
+    day_abbr = [weekday[:3] for weekday in Doomsday.weekdays]
+    if entry in day_abbr:
+        return day_abbr.index(entry)
+    return None
+
+
+def render_text(explanation: Explanation) -> str:
+    lines = [explanation.title]
+    for step in explanation.steps:
+        lines.append(step.title)
+        lines.extend(step.lines)
+    return "\n".join(lines) + "\n"
+
+
+def render_json(explanation: Explanation, **kwargs) -> str:
+    return json.dumps(explanation.to_dict(), **kwargs)
+
+
+if __name__ == "__main__":
+    explanation = Doomsday(datetime.date(1968, 3, 10)).explain()
+    print(render_text(explanation))
+    print(render_json(explanation, indent=2))
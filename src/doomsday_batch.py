@@ -0,0 +1,119 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:18:45
+Description: Vectorized doomsday engine for arrays of dates
+
+@author: tsenoner
+"""
+import datetime
+from typing import NamedTuple, Sequence, Union
+
+import numpy as np
+
+import anchors
+
+# numpy views of the tables in `anchors`, indexed by [leap, ...]
+CENTURY_ANCHORS = np.array(anchors.CENTURY_ANCHORS)
+CLOSEST_MONTH = np.array([[int(doomsday[:2]) for doomsday, _ in index] + [0] * (366 - len(index))
+                          for index in anchors.ANCHOR_INDEX])
+CLOSEST_DAY = np.array([[int(doomsday[3:]) for doomsday, _ in index] + [0] * (366 - len(index))
+                        for index in anchors.ANCHOR_INDEX])
+DIFFS = np.array([[diff for _, diff in index] + [0] * (366 - len(index))
+                  for index in anchors.ANCHOR_INDEX])
+
+
+class BatchDoomsday(NamedTuple):
+    """All doomsday variables of `Doomsday` as arrays (one entry per date)"""
+    century_doomsday: np.ndarray
+    abbr_year:        np.ndarray
+    b:                np.ndarray
+    c:                np.ndarray
+    d:                np.ndarray
+    e:                np.ndarray
+    year_doomsday:    np.ndarray
+    closest_month:    np.ndarray
+    closest_day:      np.ndarray
+    diff:             np.ndarray
+    weekday:          np.ndarray
+
+    def closest_doomsdays(self) -> np.ndarray:
+        """Closest doomsdays formatted like `Doomsday.get_closest_domesday`"""
+        return np.char.add(np.char.add(np.char.zfill(self.closest_month.astype(str), 2), "/"),
+                           np.char.zfill(self.closest_day.astype(str), 2))
+
+
+def to_datetime64(dates: Union[np.ndarray, Sequence[datetime.date]] = None,
+                  years=None, months=None, days=None) -> np.ndarray:
+    """Convert dates or year/month/day arrays into a `datetime64[D]` array
+
+    Raises ValueError for dates `datetime.date` would reject, e.g. 30.02. or
+    month 13, instead of rolling them over into the next month or year.
+    """
+    if dates is not None:
+        return np.asarray(dates, dtype="datetime64[D]")
+    years, months, days = np.broadcast_arrays(np.asarray(years, dtype=np.int64),
+                                              np.asarray(months, dtype=np.int64),
+                                              np.asarray(days, dtype=np.int64))
+    month_start = ((years - 1970) * 12 + months - 1).astype("datetime64[M]")
+    dates = month_start.astype("datetime64[D]") + (days - 1)
+    # a day past the end of the month rolls over into the next month
+    invalid = ((years < datetime.MINYEAR) | (years > datetime.MAXYEAR) |
+               (months < 1) | (months > 12) | (days < 1) |
+               (dates.astype("datetime64[M]") != month_start))
+    if invalid.any():
+        idx = np.flatnonzero(invalid)[0]
+        raise ValueError(f"invalid date at index {idx}: year {years.flat[idx]}, "
+                         f"month {months.flat[idx]}, day {days.flat[idx]}")
+    return dates
+
+
+def batch_doomsday(dates: Union[np.ndarray, Sequence[datetime.date]] = None,
+                   years=None, months=None, days=None) -> BatchDoomsday:
+    """Run the doomsday algorithm for many dates in one pass
+
+    Either pass `dates` (datetime64 array or sequence of `datetime.date`) or
+    the three arrays `years`, `months` and `days`.
+    """
+    dates = to_datetime64(dates, years, months, days)
+    year_starts = dates.astype("datetime64[Y]")
+    year = year_starts.astype(np.int64) + 1970
+    day_of_year = (dates - year_starts.astype("datetime64[D]")).astype(np.int64)
+
+    # STEP A (anchor of the century repeats every 400 years)
+    century_doomsday = CENTURY_ANCHORS[year // 100 % 4]
+    # STEP B - E
+    abbr_year = year % 100
+    b = abbr_year // 12
+    c = abbr_year % 12
+    d = c // 4
+    e = century_doomsday + b + c + d
+    year_doomsday = e % 7
+
+    # closest doomsday from the precomputed (leap, day of year) index
+    leap = ((year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))).astype(np.int64)
+    diff = DIFFS[leap, day_of_year]
+    closest_month = CLOSEST_MONTH[leap, day_of_year]
+    closest_day = CLOSEST_DAY[leap, day_of_year]
+
+    weekday = (year_doomsday + diff) % 7
+    return BatchDoomsday(century_doomsday, abbr_year, b, c, d, e, year_doomsday,
+                         closest_month, closest_day, diff, weekday)
+
+
+def batch_weekdays(dates: Union[np.ndarray, Sequence[datetime.date]] = None,
+                   years=None, months=None, days=None) -> np.ndarray:
+    """Weekday ints (0 = Sunday) of many dates"""
+    return batch_doomsday(dates, years, months, days).weekday
+
+
+def main():
+    dates = [datetime.date(1968, 3, 10), datetime.date(1994, 7, 30),
+             datetime.date(2021, 12, 31)]
+    result = batch_doomsday(dates)
+    for date, closest, weekday in zip(dates, result.closest_doomsdays(), result.weekday):
+        print(date, closest, weekday)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:44:14
+Description: Registry of weekday algorithms with step by step solutions
+
+Every engine computes the weekday (0 = Sunday) of a date and explains it
+in `Step`s, so the GUI, the CLI tools and the benchmarks can pick a mental
+calculation method by name.
+
+@author: tsenoner
+"""
+import abc
+import datetime
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Dict, List, Tuple, Type
+
+import anchors
+from doomsday import Doomsday, Explanation, Step, explain_date
+
+if TYPE_CHECKING:
+    from weekday_table import WeekdayTable  # mapped on first use
+
+WEEKDAYS: List[str] = Doomsday.weekdays
+
+
+@dataclass(frozen=True)
+class Solution:
+    """Weekday of a date with the steps of one engine"""
+    date:        datetime.date
+    weekday_int: int
+    title:       str
+    steps:       Tuple[Step, ...]
+
+    @property
+    def weekday(self) -> str:
+        return WEEKDAYS[self.weekday_int]
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["date"] = self.date.isoformat()
+        data["weekday"] = self.weekday
+        return data
+
+
+class WeekdayEngine(abc.ABC):
+    name:        str = ""
+    description: str = ""
+
+    @abc.abstractmethod
+    def weekday(self, year: int, month: int, day: int) -> int:
+        """Weekday of the date, 0 = Sunday"""
+
+    @abc.abstractmethod
+    def explain(self, date: datetime.date) -> Solution:
+        """Weekday of `date` with the steps to compute it"""
+
+    @staticmethod
+    def title(date: datetime.date) -> str:
+        return f"Explaination for {date.day:02d}-{date.month:02d}-{date.year}"
+
+
+ENGINES: Dict[str, WeekdayEngine] = {}
+
+
+def register(cls: Type[WeekdayEngine]) -> Type[WeekdayEngine]:
+    """Class decorator adding an engine instance to ENGINES"""
+    ENGINES[cls.name] = cls()
+    return cls
+
+
+def get_engine(name: str) -> WeekdayEngine:
+    try:
+        return ENGINES[name]
+    except KeyError:
+        raise ValueError(f"unknown engine '{name}', choose from {', '.join(ENGINES)}")
+
+
+@register
+class DoomsdayEngine(WeekdayEngine):
+    name = "doomsday"
+    description = "Conway's doomsday rule (century anchor + year + closest doomsday)"
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        return anchors.weekday(year, month, day)
+
+    def explain(self, date: datetime.date) -> Explanation:
+        return explain_date(date)
+
+
+@register
+class ZellerEngine(WeekdayEngine):
+    name = "zeller"
+    description = "Zeller's congruence"
+
+    @staticmethod
+    def __terms(year: int, month: int, day: int) -> Tuple[int, int, int, int]:
+        # January and February count as months 13 and 14 of the previous year
+        if month < 3:
+            month += 12
+            year -= 1
+        return day, month, year % 100, year // 100
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        q, m, K, J = self.__terms(year, month, day)
+        h = (q + 13 * (m + 1) // 5 + K + K // 4 + J // 4 + 5 * J) % 7
+        return (h + 6) % 7  # h: 0 = Saturday
+
+    def explain(self, date: datetime.date) -> Solution:
+        q, m, K, J = self.__terms(date.year, date.month, date.day)
+        terms = (q, 13 * (m + 1) // 5, K, K // 4, J // 4, 5 * J)
+        total = sum(terms)
+        h = total % 7
+        weekday_int = (h + 6) % 7
+        return Solution(date, weekday_int, self.title(date), (
+            Step("Shift the year to start in March:", (
+                f"- q = day = {q}",
+                f"- m = month = {m}" + (" (Jan/Feb count as 13/14)" if m > 12 else ""),
+                f"- K = year modulo 100 = {K}",
+                f"- J = year divisable by 100 = {J}",
+            )),
+            Step("Zeller's congruence:", (
+                "- h = q + 13(m+1)/5 + K + K/4 + J/4 + 5J",
+                f"  = {' + '.join(map(str, terms))} = {total}",
+                f"- {total} modulo 7 = {h} (0 = Saturday)",
+                f"- {h} = {WEEKDAYS[weekday_int]}",
+            )),
+        ))
+
+
+@register
+class GaussEngine(WeekdayEngine):
+    name = "gauss"
+    description = "Gauss's algorithm for January 1st + day of the year"
+
+    @staticmethod
+    def __january_first(year: int) -> Tuple[int, Tuple[int, int, int]]:
+        prev = year - 1
+        terms = (5 * (prev % 4), 4 * (prev % 100), 6 * (prev % 400))
+        return (1 + sum(terms)) % 7, terms
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        january_first, _ = self.__january_first(year)
+        return (january_first + anchors.day_of_year(year, month, day)) % 7
+
+    def explain(self, date: datetime.date) -> Solution:
+        january_first, terms = self.__january_first(date.year)
+        prev = date.year - 1
+        doy = anchors.day_of_year(date.year, date.month, date.day)
+        weekday_int = (january_first + doy) % 7
+        return Solution(date, weekday_int, self.title(date), (
+            Step(f"Weekday of January 1st {date.year}:", (
+                f"- 1 + 5({prev} mod 4) + 4({prev} mod 100) + 6({prev} mod 400)",
+                f"  = 1 + {' + '.join(map(str, terms))} = {1 + sum(terms)}",
+                f"- {1 + sum(terms)} modulo 7 = {january_first}",
+            )),
+            Step("Days since January 1st:", (
+                f"- {date.day:02d}/{date.month:02d} is {doy} days later",
+            )),
+            Step(f"Weekday of {date.day:02d}-{date.month:02d}-{date.year}:", (
+                f"- {january_first} + {doy} = {january_first + doy}",
+                f"- {january_first + doy} modulo 7 = {weekday_int} = {WEEKDAYS[weekday_int]}",
+            )),
+        ))
+
+
+@register
+class OddPlusElevenEngine(WeekdayEngine):
+    name = "odd11"
+    description = "Doomsday rule with the odd+11 year shortcut"
+
+    @staticmethod
+    def __year_doomsday(year: int, lines: List[str] = None) -> int:
+        """Doomsday of the year, the steps are appended to `lines` if given"""
+        T = year % 100
+        trace = lines.append if lines is not None else lambda line: None
+        trace(f"- T = {T:02d}")
+        if T % 2:
+            T += 11
+            trace(f"- T is odd: T + 11 = {T}")
+        T //= 2
+        trace(f"- T / 2 = {T}")
+        if T % 2:
+            T += 11
+            trace(f"- T is odd: T + 11 = {T}")
+        offset = (7 - T % 7) % 7
+        century_doomsday = anchors.century_doomsday(year)
+        year_doomsday = (century_doomsday + offset) % 7
+        if lines is not None:
+            lines += [f"- 7 - T modulo 7 = {offset}",
+                      f"- century doomsday = {century_doomsday}",
+                      f"- doomsday = {century_doomsday} + {offset} modulo 7 = {year_doomsday}"]
+        return year_doomsday
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        year_doomsday = self.__year_doomsday(year)
+        _, diff = anchors.closest_doomsday(year, month, day)
+        return (year_doomsday + diff) % 7
+
+    def explain(self, date: datetime.date) -> Solution:
+        lines = []
+        year_doomsday = self.__year_doomsday(date.year, lines)
+        closest, diff = anchors.closest_doomsday(date.year, date.month, date.day)
+        weekday_int = (year_doomsday + diff) % 7
+        return Solution(date, weekday_int, self.title(date), (
+            Step(f"Doomsday for the year {date.year}:", tuple(lines)),
+            Step("Difference to nearest doomsdays:", (
+                f"- {date.day:02d}/{date.month:02d} - {closest} = {diff}",
+            )),
+            Step(f"Weekday of {date.day:02d}-{date.month:02d}-{date.year}:", (
+                f"- {year_doomsday}{diff:+} = {year_doomsday + diff}",
+                f"- {year_doomsday + diff} modulo 7 = {weekday_int} = {WEEKDAYS[weekday_int]}",
+            )),
+        ))
+
+
+@register
+class TableEngine(WeekdayEngine):
+    name = "table"
+    description = "Lookup in the memory-mapped 400-year weekday table"
+
+    def __init__(self) -> None:
+        self.__table = None
+
+    @property
+    def table(self) -> "WeekdayTable":
+        # mapped on first use, not on import
+        if self.__table is None:
+            from weekday_table import open_table
+            self.__table = open_table()
+        return self.__table
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        return self.table.weekday(year, month, day)
+
+    def explain(self, date: datetime.date) -> Solution:
+        from weekday_table import CYCLE_YEARS, YEAR_STARTS
+        cycle_year = date.year % CYCLE_YEARS
+        idx = YEAR_STARTS[cycle_year] + anchors.day_of_year(date.year, date.month, date.day)
+        weekday_int = self.weekday(date.year, date.month, date.day)
+        return Solution(date, weekday_int, self.title(date), (
+            Step("Position in the 400-year cycle:", (
+                f"- {date.year} modulo 400 = {cycle_year}",
+                f"- day {idx} of the cycle",
+            )),
+            Step("Table lookup:", (
+                f"- table[{idx}] = {weekday_int} = {WEEKDAYS[weekday_int]}",
+            )),
+        ))
+
+
+def main():
+    date = datetime.date(1968, 3, 10)
+    for name, engine in ENGINES.items():
+        solution = engine.explain(date)
+        print(f"--- {name}: {engine.description}")
+        for step in solution.steps:
+            print(step.title)
+            print("\n".join(step.lines))
+
+
+if __name__ == "__main__":
+    main()
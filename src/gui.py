@@ -6,18 +6,26 @@ Description: GUI for the day_of_date app
 
 @author: tsenoner
 """
+import base64
+import calendar
 import datetime
-from random import randrange
 from sys import platform
 from tkinter import *
 from tkinter import ttk
-from typing import List
+from typing import TYPE_CHECKING, Callable, List
 
-from PIL import Image, ImageTk
+from cheatsheet import load_cheatsheet
+from anchors import DISTANCE_BUCKETS
+from db_api import ACCURACY_CATEGORIES, Database
+from doomsday import parse_weekday
+from explanation import create_explanation_text
+from instrumentation import timed
+from prefetch import Question, QuestionPipeline
+from progress import ProgressChart
+from scheduler import Scheduler
 
-from db_api import Database
-from explanation import Doomsday
-from progress import show_progress
+if TYPE_CHECKING:
+    from PIL import ImageTk  # imported when the cheatsheet is opened
 
 
 class GUI:
@@ -26,14 +34,33 @@ class GUI:
     db:        Database
     date:      datetime.date
     last_date: datetime.date = None
+    question:      Question = None
+    last_question: Question = None
     # recs:      List[tuple]
 
+    # rasterize the SVG cheatsheet at window size instead of scaling the PNG
+    cheatsheet_svg:     bool = False
+    cheatsheet_photo:   "ImageTk.PhotoImage" = None
+
     nr_questions:       int = 0
     nr_correct_results: int = 0
 
-    def __init__(self, db: Database = None) -> None:
+    def __init__(self, db: Database = None,
+                 on_ready: Callable[["GUI"], None] = None,
+                 scheduler: Scheduler = None, seed: int = None,
+                 engine: str = "doomsday") -> None:
+        """`on_ready` is called once the first question is shown; with a
+        `scheduler` dates are drawn by error rate instead of uniformly, else
+        `seed` makes the sequence of dates reproducible. The explanations
+        show the steps of the registered weekday `engine`."""
         self.db = db
+        self.on_ready = on_ready
+        self.scheduler = scheduler
+        self.pipeline = QuestionPipeline(scheduler, seed=seed, engine=engine)
         self.recs = []
+        self.progress_chart = ProgressChart()
+        self.shown_progress_version = None
+        self.shown_accuracy = None
         self.__setup()
 
     def __setup(self) -> None:
@@ -83,17 +110,11 @@ class GUI:
         ttk.Label(mainframe, textvariable=self.session_state_text).grid(
             row=1, column=3, sticky=W)
 
-        # --- info icon ---
-        info_icon_white = PhotoImage(file="img/info_white.png")
-        info_icon_black = PhotoImage(file="img/info_black.png")
+        # --- info icon (images are loaded after the first frame) ---
         curser = "pointinghand" if platform == "darwin" else "draft_large"
-        info_icon = ttk.Label(mainframe, image=info_icon_white, cursor=curser)
+        info_icon = ttk.Label(mainframe, cursor=curser)
         info_icon.grid(row=1, column=3, sticky=E)
         info_icon.bind("<Button-1>", self.info_window)
-        info_icon.bind("<Enter>",
-                       lambda event: self.__change_icon(info_icon_black, event))
-        info_icon.bind("<Leave>",
-                       lambda event: self.__change_icon(info_icon_white, event))
 
         # ---------- ROW 2 ----------
         # --- guessed day ---
@@ -129,11 +150,36 @@ class GUI:
 
         # ---------- Statistics frame ----------
         self.stat_label = ttk.Label(stat_frame)
-        self.stat_label.grid(row=1, column=1, sticky=(N, W, E, S))
+        self.stat_label.grid(row=1, column=1, columnspan=2, sticky=(N, W, E, S))
+
+        # --- accuracy per category ---
+        ttk.Label(stat_frame, text="Accuracy by:").grid(row=2, column=1, sticky=E)
+        self.accuracy_by = StringVar(value=ACCURACY_CATEGORIES[0])
+        accuracy_box = ttk.Combobox(stat_frame, textvariable=self.accuracy_by, width=10,
+                                    values=ACCURACY_CATEGORIES, state="readonly")
+        accuracy_box.grid(row=2, column=2, sticky=W)
+        accuracy_box.bind("<<ComboboxSelected>>", self.__update_accuracy)
+        self.accuracy_table = ttk.Treeview(stat_frame, columns=("attempts", "accuracy"),
+                                           height=6)
+        self.accuracy_table.heading("#0", text="category")
+        self.accuracy_table.heading("attempts", text="attempts")
+        self.accuracy_table.heading("accuracy", text="accuracy")
+        for column in ("#0", "attempts", "accuracy"):
+            self.accuracy_table.column(column, width=100, anchor=E)
+        self.accuracy_table.grid(row=3, column=1, columnspan=2, sticky=(W, E))
+        # the table only counts the hot database, not the monthly archives
+        self.accuracy_note = StringVar()
+        ttk.Label(stat_frame, textvariable=self.accuracy_note).grid(
+            row=4, column=1, columnspan=2, sticky=W)
         notebook.bind("<<NotebookTabChanged>>", self.__update_progress)
 
         self.__preparation()
+        if self.on_ready is not None:
+            self.root.after_idle(self.on_ready, self)
+        self.root.after_idle(self.__load_info_icons, info_icon)
         self.root.mainloop()
+        self.progress_chart.close()
+        self.pipeline.close()
 
     def __preparation(self):
         self.gen_random_date()
@@ -153,6 +199,15 @@ class GUI:
             center = width, height, x_pos, y_pos
         return center
 
+    def __load_info_icons(self, info_icon):
+        info_icon_white = PhotoImage(file="img/info_white.png")
+        info_icon_black = PhotoImage(file="img/info_black.png")
+        info_icon.configure(image=info_icon_white)
+        info_icon.bind("<Enter>",
+                       lambda event: self.__change_icon(info_icon_black, event))
+        info_icon.bind("<Leave>",
+                       lambda event: self.__change_icon(info_icon_white, event))
+
     def __change_icon(self, img, event):
         event.widget.configure(image=img)
 
@@ -160,6 +215,7 @@ class GUI:
         win.protocol("WM_DELETE_WINDOW", lambda: [
                      win.destroy(), self.day_field.focus()])
 
+    @timed("GUI.info_window")
     def info_window(self, event):
         width, height = 800, 650
         novi = Toplevel(self.root)
@@ -173,45 +229,25 @@ class GUI:
         canvas = Canvas(novi, width=width, height=height)
         canvas.pack(expand=YES, fill=BOTH)
 
-        image = Image.open("doc/universal_cal.png")
-        image = image.resize((width-30, height-30))
-        cheatsheet = ImageTk.PhotoImage(image)
+        if self.cheatsheet_photo is None:
+            from PIL import ImageTk  # only needed once the cheatsheet is opened
+            image = load_cheatsheet((width-30, height-30), use_svg=self.cheatsheet_svg)
+            self.cheatsheet_photo = ImageTk.PhotoImage(image)
+        cheatsheet = self.cheatsheet_photo
         canvas.create_image(15, 15, image=cheatsheet, anchor=(NW))
         canvas.cheatsheet = cheatsheet
         self.__change_focus_after_win_close(novi)
 
-    def gen_random_date(self, event=None, start_year: int = 1500, end_year: int = 2500):
-        assert end_year >= start_year, "'end_year' has to be larger than 'start_year'"
-        min_date = datetime.date(start_year, 1, 1)
-        max_date = datetime.date(end_year, 12, 31)
-        delta = max_date - min_date
-        int_delta = (delta.days)
-        random_day = randrange(int_delta)
-        date = min_date + datetime.timedelta(days=random_day)
-        self.date = date
-        self.date_text.set(date.strftime("%d-%m-%Y"))
+    @timed("GUI.next_question")
+    def gen_random_date(self, event=None):
+        # weekday and explanation were computed ahead by the pipeline
+        self.question = self.pipeline.next()
+        self.date = self.question.date
+        # from the date: only the doomsday `Explanation` has a `nice_date`
+        self.date_text.set(f"{self.date.day:02d}-{self.date.month:02d}-{self.date.year}")
 
     def __translate_entry(self) -> int:
-        entered_text = self.entered_day.get()
-        day_abbr = [weekday[:3] for weekday in self.weekdays]
-
-        # check if enteret text is numeric
-        if entered_text.isnumeric():
-            day = int(entered_text)
-            if day >= 0 and day <= 6:
-                result = day
-            else:
-                result = None
-        # else check if it matches a weekday (full name or three letters)
-        else:
-            entry = entered_text.capitalize()
-            if entry in self.weekdays:
-                result = self.weekdays.index(entry)
-            elif entry in day_abbr:
-                result = day_abbr.index(entry)
-            else:
-                result = None
-        return result
+        return parse_weekday(self.entered_day.get())
 
     def __get_formatted_info(self) -> str:
         formatted_date = self.date.strftime('%d-%m-%Y')
@@ -228,16 +264,67 @@ class GUI:
         text = f"{self.nr_correct_results} / {self.nr_questions}"
         self.session_state_text.set(text)
 
+    @timed("GUI.__update_progress")
     def __update_progress(self, event=None):
-        # check if a database is connected and that at least one row is present
-        if self.db is not None and self.db.is_not_empty():
+        # check if a database is connected and that at least one attempt is
+        # recorded; the rollup still counts the archived ones
+        if self.db is not None and self.db.get_data_version()[1]:
             # check if the second tab 'Statistics' is selected
             if event is not None and event.widget.index("current") == 1:
-                show_progress(self.db)
-                stat_img = PhotoImage(file="img/stat.png")
-                self.stat_label.configure(image=stat_img)
-                self.stat_label.image = stat_img
-
+                version, future = self.progress_chart.render(self.db)
+                if version != self.shown_progress_version:
+                    self.__show_progress_when_done(version, future)
+                self.__update_accuracy()
+
+    @staticmethod
+    def __category_label(by: str, category: int) -> str:
+        if by == "century":
+            return f"{category * 100}s"
+        if by == "month":
+            return calendar.month_abbr[category]
+        if by == "weekday":
+            return GUI.weekdays[category]
+        if by == "leap":
+            return "leap" if category else "common"
+        # distance to the closest doomsday in days
+        lower = DISTANCE_BUCKETS[category - 1] + 1 if category else 0
+        upper = DISTANCE_BUCKETS[category]
+        if category == len(DISTANCE_BUCKETS) - 1:
+            return f"{lower}+ days"
+        return f"{lower}-{upper} days" if lower != upper else f"{upper} days"
+
+    @timed("GUI.__update_accuracy")
+    def __update_accuracy(self, event=None):
+        # index-only GROUP BY queries, rerun only for new data or another category
+        if self.db is None:
+            return
+        by = self.accuracy_by.get()
+        key = (by, self.db.get_data_version())
+        if key == self.shown_accuracy:
+            return
+        self.accuracy_table.delete(*self.accuracy_table.get_children())
+        for category, attempts, correct in self.db.get_accuracy(by):
+            self.accuracy_table.insert("", END, text=self.__category_label(by, category),
+                                       values=(attempts, f"{correct / attempts:.1%}"))
+        if self.db.archive_months():
+            self.accuracy_note.set(f"last {self.db.archive_after_days} days only, "
+                                   "older attempts are archived")
+        self.shown_accuracy = key
+
+    def __show_progress_when_done(self, version, future):
+        # poll the render worker instead of blocking the event loop
+        if not future.done():
+            self.root.after(50, self.__show_progress_when_done, version, future)
+            return
+        # a newer render was started in the meantime
+        if version != self.progress_chart.version:
+            return
+        stat_img = PhotoImage(data=base64.b64encode(future.result()))
+        self.stat_label.configure(image=stat_img)
+        self.stat_label.image = stat_img
+        self.shown_progress_version = version
+
+    @timed("GUI.submit")
     def submit(self, event=None):
         weekday = self.__translate_entry()
         if weekday is None:
@@ -245,7 +332,7 @@ class GUI:
             self.__display_message("ERROR:\n", "red", msg)
         else:
             msg = self.__get_formatted_info()
-            actual_weekday = self.date.isoweekday() % 7
+            actual_weekday = self.question.weekday_int
             if weekday == actual_weekday:
                 header = "CORRECT:\n"
                 color = "green"
@@ -261,7 +348,9 @@ class GUI:
                 self.nr_correct_results += 1
             self.__update_session_state()
 
-            # enter data into Database
+            self.pipeline.record(self.date, actual_weekday == weekday)
+
+            # enter data into Database (queued with a write-behind Database)
             if self.db is not None:
                 self.db.insert(date=self.date,
                                real_day=self.weekdays[actual_weekday],
@@ -269,8 +358,10 @@ class GUI:
 
             # Generate next date
             self.last_date = self.date
+            self.last_question = self.question
             self.__preparation()
 
+    @timed("GUI.explain")
     def explain(self, event=None):
         if self.last_date is None:
             msg = "First try to guess the date.\nI can explain it to you later."
@@ -290,8 +381,7 @@ class GUI:
             self.__change_focus_after_win_close(novi)
 
             # create the explanation text
-            doom = Doomsday(self.last_date)
-            doom.create_explanation_text(novi)
+            create_explanation_text(self.last_question.explanation, novi)
 
     def records(self) -> List[tuple]:
         return self.recs
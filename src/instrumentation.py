@@ -0,0 +1,107 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:28:19
+Description: Lightweight wall-time histograms for hot paths
+
+Enabled with the environment variable DAYOFDATE_METRICS=1. When disabled,
+`timed` returns the undecorated function and `ENABLED` guards all inline
+timers, so the instrumentation costs nothing.
+
+@author: tsenoner
+"""
+import atexit
+import functools
+import math
+import os
+import sys
+import threading
+from time import perf_counter
+from typing import Callable, Dict, List, TextIO, Tuple
+
+ENV_VAR = "DAYOFDATE_METRICS"
+ENABLED: bool = os.environ.get(ENV_VAR, "") not in ("", "0")
+
+# bucket width: every bucket is 5% wider than the previous one
+_BASE = 1.05
+_LOG_BASE = math.log(_BASE)
+
+
+class Histogram:
+    """Log-bucketed histogram of durations in microseconds"""
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, us: float) -> None:
+        bucket = int(math.log(us) / _LOG_BASE) if us >= 1 else 0
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += us
+        self.maximum = max(self.maximum, us)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket holding the `fraction` quantile"""
+        rank = fraction * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(_BASE ** (bucket + 1), self.maximum)
+        return self.maximum
+
+
+_histograms: Dict[str, Histogram] = {}
+_lock = threading.Lock()
+
+
+def record(name: str, seconds: float) -> None:
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = Histogram()
+        histogram.add(seconds * 1e6)
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """Decorator recording the wall time of every call under `name`"""
+    def decorator(func: Callable) -> Callable:
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def summary() -> List[Tuple[str, int, float, float, float, float]]:
+    """(name, count, mean, p50, p95, p99) per histogram, times in ms"""
+    with _lock:
+        return [(name, hist.count, hist.total / hist.count / 1e3,
+                 hist.percentile(0.50) / 1e3, hist.percentile(0.95) / 1e3,
+                 hist.percentile(0.99) / 1e3)
+                for name, hist in sorted(_histograms.items())]
+
+
+def dump(file: TextIO = sys.stderr) -> None:
+    rows = summary()
+    if not rows:
+        return
+    print(f"{'metric':<36}{'count':>8}{'mean ms':>10}{'p50 ms':>10}"
+          f"{'p95 ms':>10}{'p99 ms':>10}", file=file)
+    for name, count, mean, p50, p95, p99 in rows:
+        print(f"{name:<36}{count:>8}{mean:>10.3f}{p50:>10.3f}{p95:>10.3f}{p99:>10.3f}",
+              file=file)
+
+
+if ENABLED:
+    atexit.register(dump)
@@ -0,0 +1,154 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:36:47
+Description: Load-test client for the local quiz service
+
+Every virtual user drills on its own keep-alive connection: next date,
+answer, and now and then an explanation and the stats. Reports requests/s
+and the latency percentiles per endpoint.
+
+usage:
+    python src/loadtest.py --users 50 --seconds 10               # in-process server
+    python src/loadtest.py --url http://127.0.0.1:8080 --users 50
+
+@author: tsenoner
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+import anchors
+from db_api import Database
+from doomsday import Doomsday
+from instrumentation import Histogram
+from server import serve
+
+LOADTEST_DB = "loadtest"
+
+
+class Client:
+    """One keep-alive HTTP/1.1 connection"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host: str, port: int) -> "Client":
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, method: str, target: str, payload: dict = None) -> Tuple[int, dict]:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = (f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+        self.writer.write(head.encode("latin-1") + body)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def virtual_user(name: str, host: str, port: int, deadline: float, accuracy: float,
+                       rng: random.Random, histograms: Dict[str, Histogram],
+                       errors: Dict[str, int]) -> None:
+    client = await Client.connect(host, port)
+
+    async def timed_request(endpoint: str, method: str, target: str,
+                            payload: dict = None) -> dict:
+        start = time.perf_counter()
+        status, body = await client.request(method, target, payload)
+        histograms.setdefault(endpoint, Histogram()).add((time.perf_counter() - start) * 1e6)
+        if status != 200:
+            errors[endpoint] = errors.get(endpoint, 0) + 1
+        return body
+
+    try:
+        while time.monotonic() < deadline:
+            question = await timed_request("next", "GET", f"/next?user={name}")
+            year, month, day = map(int, question["date"].split("-"))
+            weekday = anchors.weekday(year, month, day)
+            if rng.random() > accuracy:
+                weekday = (weekday + rng.randrange(1, 7)) % 7
+            await timed_request("answer", "POST", "/answer",
+                                {"user": name, "answer": Doomsday.weekdays[weekday][:3]})
+            if rng.random() < 0.2:
+                await timed_request("explanation", "GET", f"/explanation?user={name}")
+            if rng.random() < 0.1:
+                await timed_request("stats", "GET", f"/stats?user={name}")
+    finally:
+        await client.close()
+
+
+async def run(args: argparse.Namespace) -> Tuple[Dict[str, Histogram], Dict[str, int], float]:
+    server = db = None
+    if args.url is None:
+        Database.remove_files(LOADTEST_DB)
+        db = Database(LOADTEST_DB, write_behind=True, multi_user=True)
+        server = await serve(db, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+    else:
+        url = urlsplit(args.url)
+        host, port = url.hostname, url.port or 80
+
+    histograms: Dict[str, Histogram] = {}
+    errors: Dict[str, int] = {}
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    deadline = time.monotonic() + args.seconds
+    try:
+        await asyncio.gather(*(
+            virtual_user(f"user{idx}", host, port, deadline, args.accuracy,
+                         random.Random(rng.random()), histograms, errors)
+            for idx in range(args.users)))
+    finally:
+        seconds = time.perf_counter() - start
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+            db.close()
+            Database.remove_files(LOADTEST_DB)
+    return histograms, errors, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the quiz service")
+    parser.add_argument("--url", help="running service (default: start one in-process "
+                                      f"on data/{LOADTEST_DB}.db)")
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--accuracy", type=float, default=0.8,
+                        help="share of correct answers")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    histograms, errors, seconds = asyncio.run(run(args))
+
+    total = sum(hist.count for hist in histograms.values())
+    print(f"{args.users} users, {total:,} requests in {seconds:.1f} s "
+          f"-> {total / seconds:,.0f} req/s")
+    print(f"{'endpoint':<14}{'count':>8}{'req/s':>9}{'errors':>8}"
+          f"{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}")
+    for endpoint, hist in sorted(histograms.items()):
+        print(f"{endpoint:<14}{hist.count:>8}{hist.count / seconds:>9.0f}"
+              f"{errors.get(endpoint, 0):>8}{hist.percentile(0.50) / 1e3:>9.2f}"
+              f"{hist.percentile(0.95) / 1e3:>9.2f}{hist.percentile(0.99) / 1e3:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,14 +6,41 @@ Description: Get day of week from a given date
 
 @author: tsenoner
 """
+import argparse
+from typing import Callable
+
+import instrumentation
 from db_api import Database
+from engines import ENGINES
 from gui import GUI
+from scheduler import Scheduler
 
 
-def main():
-    with Database("log") as db:
-        GUI(db)
+def run(db_name: str = "log", seed: int = None, engine: str = "doomsday",
+        on_ready: Callable[[GUI], None] = None) -> None:
+    """Open `data/<db_name>.db`, play until the window is closed, archive"""
+    with Database(db_name, write_behind=True) as db:
+        if seed is not None:
+            GUI(db, seed=seed, engine=engine, on_ready=on_ready)
+        else:
+            scheduler = Scheduler()
+            scheduler.warm_start(db)
+            GUI(db, scheduler=scheduler, engine=engine, on_ready=on_ready)
+        # keep data/log.db small, see data/archive/; only once enough old
+        # attempts piled up, so that most exits skip the move and the VACUUM
+        db.archive(min_rows=db.archive_min_rows)
+        if instrumentation.ENABLED:
+            db.save_metrics(instrumentation.summary())
 
 
+def main():
+    parser = argparse.ArgumentParser(description="Train the doomsday algorithm")
+    parser.add_argument("--seed", type=int,
+                        help="reproducible uniform drill instead of the adaptive scheduler")
+    parser.add_argument("--engine", choices=ENGINES, default="doomsday",
+                        help="method shown in the explanations")
+    args = parser.parse_args()
+    run(seed=args.seed, engine=args.engine)
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,130 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:42:22
+Description: Prefetched question pipeline
+
+A background thread keeps a small ready queue of upcoming questions, each
+with its weekday and explanation already computed, so showing the next
+question only pops from the queue. Only the filler thread draws dates,
+hence a seed reproduces the drill.
+
+@author: tsenoner
+"""
+import datetime
+import queue
+import random
+import threading
+from dataclasses import dataclass
+
+from doomsday import random_date
+from engines import Solution, get_engine
+from scheduler import Scheduler
+
+
+@dataclass(frozen=True)
+class Question:
+    date:        datetime.date
+    weekday_int: int
+    explanation: Solution  # or the doomsday `Explanation`
+
+
+class QuestionPipeline:
+    depth:      int = 4
+    start_year: int = 1500
+    end_year:   int = 2500
+
+    def __init__(self, scheduler: Scheduler = None, seed: int = None, depth: int = None,
+                 start_year: int = None, end_year: int = None,
+                 engine: str = "doomsday") -> None:
+        """Questions come from `scheduler` if given, else uniformly from
+        [start_year, end_year] drawn with a `random.Random(seed)`, and are
+        explained by the registered `engine`
+
+        With a scheduler, the queued questions do not yet reflect the last
+        `depth` answers. With `depth` 0 there is no filler thread and `next`
+        makes every question itself, e.g. to profile it in the caller.
+        """
+        self.scheduler = scheduler
+        self.rng = random.Random(seed)
+        self.engine = get_engine(engine)
+        if depth is not None:
+            self.depth = depth
+        if start_year is not None:
+            self.start_year = start_year
+        if end_year is not None:
+            self.end_year = end_year
+        # questions served without waiting / after waiting for the filler
+        self.hits = 0
+        self.misses = 0
+        # the scheduler is drawn from the filler and updated from the caller
+        self.__lock = threading.Lock()
+        self.__ready = queue.Queue(maxsize=self.depth)
+        self.__stopped = threading.Event()
+        self.__filler = None
+        if self.depth > 0:
+            self.__filler = threading.Thread(target=self.__fill_loop,
+                                             name="question-prefetch", daemon=True)
+            self.__filler.start()
+
+    def __enter__(self) -> "QuestionPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __make_question(self) -> Question:
+        if self.scheduler is not None:
+            with self.__lock:
+                date = self.scheduler.next_date()
+        else:
+            date = random_date(self.start_year, self.end_year, self.rng)
+        explanation = self.engine.explain(date)
+        return Question(date, explanation.weekday_int, explanation)
+
+    def __fill_loop(self) -> None:
+        question = None
+        while not self.__stopped.is_set():
+            if question is None:
+                question = self.__make_question()
+            try:
+                self.__ready.put(question, timeout=0.1)
+                question = None
+            except queue.Full:
+                pass
+
+    def next(self) -> Question:
+        """The next question; only blocks if the queue ran dry"""
+        if self.__filler is None:
+            self.misses += 1
+            return self.__make_question()
+        try:
+            question = self.__ready.get_nowait()
+            self.hits += 1
+        except queue.Empty:
+            question = self.__ready.get()
+            self.misses += 1
+        return question
+
+    def record(self, date: datetime.date, correct: bool) -> None:
+        """Feed an answer back into the scheduler (if any)"""
+        if self.scheduler is not None:
+            with self.__lock:
+                self.scheduler.record(date, correct)
+
+    def close(self) -> None:
+        self.__stopped.set()
+        if self.__filler is not None:
+            self.__filler.join()
+
+
+def main():
+    with QuestionPipeline(seed=0) as first, QuestionPipeline(seed=0) as second:
+        dates = [first.next().date for _ in range(10)]
+        assert dates == [second.next().date for _ in range(10)]
+    for date in dates:
+        print(date)
+
+
+if __name__ == "__main__":
+    main()
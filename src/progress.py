@@ -6,29 +6,29 @@ Description: Performance statistics
 
 @author: tsenoner
 """
-import matplotlib.pyplot as plt
+import io
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Tuple
 
 from db_api import Database
+from instrumentation import timed
 
 
-def show_progress(db: Database):
-    querry = "SELECT time, correct FROM dates"
-    data = db.get_data(querry)
+@timed("render_progress")
+def render_progress(summary: List[tuple]) -> bytes:
+    """Bar chart of correct/wrong answers per day as PNG bytes
+
+    Uses the object oriented matplotlib API only, so it is safe to call from
+    a worker thread. matplotlib is imported here to keep it out of the
+    application start.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
 
     # structured_data = {date: [nr_wrong, nr_correct]}
-    structured_data = {}
-    for time, correct in data:
-        date = time.date()
-        if correct:
-            structured_data.setdefault(date, [0, 0])[1] += 1
-        else:
-            structured_data.setdefault(date, [0, 0])[0] += 1
-
-    # structured_data[datetime.date(2021, 12, 9)] = [5, 4]
-    # structured_data[datetime.date(2021, 12, 7)] = [7, 4]
-    # print(type(list(structured_data.keys())[0]))
-    # tmp = sorted(structured_data.keys())[-10:]
-    # print(tmp)
+    structured_data = {day: [n_wrong, n_correct]
+                       for day, n_correct, n_wrong in summary}
 
     x_val = [date.strftime("%d-%m") for date in structured_data.keys()]
     x_val_idx = list(range(len(x_val)))
@@ -36,7 +36,8 @@ def show_progress(db: Database):
 
     width = 0.35
 
-    fig = plt.figure(figsize=(4.75, 1.75), dpi=75)
+    fig = Figure(figsize=(4.75, 1.75), dpi=75)
+    FigureCanvasAgg(fig)
     ax = fig.add_subplot(111)
 
     ax.bar(x_val_idx, correct,
@@ -50,13 +51,51 @@ def show_progress(db: Database):
     ax.set_xticklabels(x_val)
     ax.legend()
 
-    plt.savefig("img/stat.png", bbox_inches='tight')
-    # plt.show()
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches='tight')
+    return buffer.getvalue()
+
+
+@timed("show_progress")
+def show_progress(db: Database) -> bytes:
+    return render_progress(db.get_daily_summary())
+
+
+class ProgressChart:
+    """Renders the progress chart in a worker thread, memoized per data version
+
+    The database reads of `render` use pooled read-only connections and work
+    from any thread; they run in the caller, so the version and the summary
+    are read together. Only the plotting runs in the worker.
+    """
+    version: Tuple[int, int] = None
+    future:  Future = None
+
+    def __init__(self) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="progress")
+
+    def render(self, db: Database) -> Tuple[Tuple[int, int], Future]:
+        """Return the data version and a future of the PNG bytes
+
+        The chart is only re-rendered if attempts were added or removed since
+        the last call, otherwise the cached (or in-flight) future is returned.
+        """
+        version = db.get_data_version()
+        if version != self.version:
+            self.version = version
+            self.future = self.executor.submit(render_progress,
+                                               db.get_daily_summary())
+        return self.version, self.future
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
     with Database(db_name="log") as db:
-        show_progress(db)
+        png = show_progress(db)
+    Path("img/stat.png").write_bytes(png)
 
 
 if __name__ == "__main__":
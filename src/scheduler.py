@@ -0,0 +1,173 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:27:36
+Description: Error-weighted adaptive date scheduler
+
+Dates are bucketed into categories (century, month, leap year, distance to the
+closest doomsday). Every category is drawn with a weight equal to its smoothed
+error rate times its number of dates, so without any history the drill is
+uniform over the dates; the weights live in a Fenwick tree, so an update
+after an answer and a draw are both O(log n).
+
+@author: tsenoner
+"""
+import bisect
+import datetime
+import random
+from typing import Dict, List, Tuple
+
+import anchors
+from anchors import DISTANCE_BUCKETS, distance_bucket
+from db_api import Database
+
+
+class FenwickTree:
+    """Prefix sums over non-negative weights with O(log n) update and search"""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.tree = [0.0] * (size + 1)
+        self.weights = [0.0] * size
+
+    def set(self, idx: int, weight: float) -> None:
+        delta = weight - self.weights[idx]
+        self.weights[idx] = weight
+        idx += 1
+        while idx <= self.size:
+            self.tree[idx] += delta
+            idx += idx & -idx
+
+    def total(self) -> float:
+        total, idx = 0.0, self.size
+        while idx > 0:
+            total += self.tree[idx]
+            idx -= idx & -idx
+        return total
+
+    def find(self, value: float) -> int:
+        """Smallest index whose prefix sum exceeds `value`"""
+        pos, step = 0, 1 << self.size.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= self.size and self.tree[nxt] <= value:
+                pos = nxt
+                value -= self.tree[nxt]
+            step >>= 1
+        return min(pos, self.size - 1)
+
+
+class Scheduler:
+    # Beta prior of the error rate, unseen categories start at 0.5
+    prior_errors:  float = 1.0
+    prior_correct: float = 1.0
+
+    def __init__(self, start_year: int = 1500, end_year: int = 2500,
+                 rng: random.Random = None) -> None:
+        self.start_year = start_year
+        self.end_year = end_year
+        self.rng = rng or random.Random()
+
+        # years per (century, leap) and days per (leap, month, bucket)
+        self.years: Dict[Tuple[int, int], List[int]] = {}
+        for year in range(start_year, end_year + 1):
+            self.years.setdefault((year // 100, int(anchors.is_leap(year))), []).append(year)
+        self.days: Dict[Tuple[int, int, int], List[Tuple[int, int]]] = {}
+        for leap in (0, 1):
+            for month in range(1, 13):
+                n_days = (anchors.MONTH_STARTS[leap][month] if month < 12 else 365 + leap) \
+                    - anchors.MONTH_STARTS[leap][month - 1]
+                for day in range(1, n_days + 1):
+                    _, diff = anchors.ANCHOR_INDEX[leap][anchors.MONTH_STARTS[leap][month - 1] + day - 1]
+                    self.days.setdefault((leap, month, distance_bucket(diff)), []).append((month, day))
+
+        # only categories that contain at least one date
+        self.categories: List[Tuple[int, int, int, int]] = [
+            (century, month, leap, bucket)
+            for century, leap in sorted(self.years)
+            for month in range(1, 13)
+            for bucket in range(len(DISTANCE_BUCKETS))
+            if (leap, month, bucket) in self.days]
+        self.index = {category: idx for idx, category in enumerate(self.categories)}
+        # number of dates per category
+        self.sizes = [len(self.years[century, leap]) * len(self.days[leap, month, bucket])
+                      for century, month, leap, bucket in self.categories]
+        self.attempts = [0] * len(self.categories)
+        self.errors = [0] * len(self.categories)
+        self.tree = FenwickTree(len(self.categories))
+        for idx in range(len(self.categories)):
+            self.tree.set(idx, self.weight(idx) * self.sizes[idx])
+
+    def category(self, date: datetime.date) -> Tuple[int, int, int, int]:
+        _, diff = anchors.closest_doomsday(date.year, date.month, date.day)
+        return (date.year // 100, date.month, int(anchors.is_leap(date.year)),
+                distance_bucket(diff))
+
+    def weight(self, idx: int) -> float:
+        """Posterior mean of the error rate of a category"""
+        return ((self.errors[idx] + self.prior_errors) /
+                (self.attempts[idx] + self.prior_errors + self.prior_correct))
+
+    def record(self, date: datetime.date, correct: bool, count: int = 1) -> None:
+        self.record_many(date, count, 0 if correct else count)
+
+    def record_many(self, date: datetime.date, attempts: int, errors: int) -> None:
+        self.__record_category(self.category(date), attempts, errors)
+
+    def __record_category(self, category: Tuple[int, int, int, int], attempts: int,
+                          errors: int) -> None:
+        idx = self.index.get(category)
+        if idx is None:  # outside of the scheduled centuries
+            return
+        self.attempts[idx] += attempts
+        self.errors[idx] += errors
+        self.tree.set(idx, self.weight(idx) * self.sizes[idx])
+
+    def next_date(self) -> datetime.date:
+        # every year of a category holds the same days, so uniform draws of
+        # the year and the day give each date of the category the same chance
+        idx = self.tree.find(self.rng.random() * self.tree.total())
+        century, month, leap, bucket = self.categories[idx]
+        year = self.rng.choice(self.years[century, leap])
+        month, day = self.rng.choice(self.days[leap, month, bucket])
+        return datetime.date(year, month, day)
+
+    def warm_start(self, db: Database) -> None:
+        """Load the error rates of the existing history from the `date_summary`
+        rollup
+
+        At most one row per century, leap and day of the year, so the cost
+        does not grow with the history; archived attempts still count, and
+        so do attempts of years outside the range in a scheduled century.
+        """
+        for century, leap, doy, n_correct, n_wrong in db.get_date_summary():
+            month = bisect.bisect_right(anchors.MONTH_STARTS[leap], doy)
+            bucket = distance_bucket(anchors.ANCHOR_INDEX[leap][doy][1])
+            self.__record_category((century, month, leap, bucket), n_correct + n_wrong, n_wrong)
+
+    def error_rates(self) -> List[Tuple[Tuple[int, int, int, int], float, int]]:
+        """(category, error rate, attempts) sorted from hardest to easiest"""
+        return sorted(((category, self.weight(idx), self.attempts[idx])
+                       for idx, category in enumerate(self.categories)),
+                      key=lambda item: -item[1])
+
+
+def main():
+    with Database() as db:
+        scheduler = Scheduler(rng=random.Random(0))
+        for _ in range(5000):
+            date = scheduler.next_date()
+            # pretend January/February dates are always wrong
+            correct = date.month > 2
+            db.insert(date, "Monday", "Monday" if correct else "Friday")
+        scheduler.warm_start(db)
+        counts = {}
+        for _ in range(2000):
+            month = scheduler.next_date().month
+            counts[month] = counts.get(month, 0) + 1
+    print(f"{len(scheduler.categories)} categories")
+    print("draws per month:", dict(sorted(counts.items())))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:36:47
+Description: Local multi-user quiz service (HTTP/JSON on asyncio)
+
+All attempts go through one write-behind `Database`, so the writer thread is
+the single serialized writer and a submit never waits for SQLite. Reads run
+in worker threads via `asyncio.to_thread`.
+
+endpoints:
+    GET  /next?user=ann                  new date for a user
+    POST /answer  {"user": "ann", "answer": "Tue"}
+    GET  /explanation?date=1994-07-30    (or ?user=ann for the last answered date,
+                                          &engine=zeller for another method)
+    GET  /stats?user=ann
+
+usage:
+    python src/server.py --db quiz --port 8080
+
+@author: tsenoner
+"""
+import argparse
+import asyncio
+import datetime
+import json
+import random
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from db_api import Database
+from doomsday import Doomsday, explain_date, parse_weekday, random_date, render_text
+from engines import get_engine
+
+REASONS: Dict[int, str] = {200: "OK", 400: "Bad Request", 404: "Not Found",
+                           405: "Method Not Allowed", 409: "Conflict",
+                           500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class QuizService:
+    """Per-user quiz state on top of a (write-behind) `Database`"""
+
+    def __init__(self, db: Database, start_year: int = 1500, end_year: int = 2500,
+                 rng: random.Random = None) -> None:
+        self.db = db
+        self.start_year = start_year
+        self.end_year = end_year
+        self.rng = rng or random.Random()
+        # the event loop is single threaded, no locking needed
+        self.pending: Dict[str, datetime.date] = {}
+        self.last: Dict[str, datetime.date] = {}
+
+    @staticmethod
+    def __user(params: dict) -> str:
+        user = params.get("user")
+        if not isinstance(user, str) or not user.strip():
+            raise HTTPError(400, "missing 'user'")
+        return user.strip()
+
+    async def next_date(self, params: dict) -> dict:
+        user = self.__user(params)
+        date = random_date(self.start_year, self.end_year, self.rng)
+        self.pending[user] = date
+        # strftime does not zero-pad years below 1000
+        nice_date = f"{date.day:02d}-{date.month:02d}-{date.year:04d}"
+        return {"user": user, "date": date.isoformat(), "nice_date": nice_date}
+
+    async def answer(self, params: dict) -> dict:
+        user = self.__user(params)
+        date = self.pending.get(user)
+        if date is None:
+            raise HTTPError(409, f"no open question for '{user}', GET /next first")
+        guess = parse_weekday(str(params.get("answer", "")))
+        if guess is None:
+            raise HTTPError(400, "'answer' has to be 0-6, a weekday or its abbreviation")
+        del self.pending[user]
+        self.last[user] = date
+        real = explain_date(date).weekday_int
+        # only queues the row, the writer thread commits it in a batch
+        self.db.insert(date, real, guess, user=user)
+        return {"user": user, "date": date.isoformat(), "answer": Doomsday.weekdays[guess],
+                "weekday": Doomsday.weekdays[real], "correct": guess == real}
+
+    async def explanation(self, params: dict) -> dict:
+        if "date" in params:
+            try:
+                date = datetime.date.fromisoformat(params["date"])
+            except ValueError as err:
+                raise HTTPError(400, str(err))
+        else:
+            user = self.__user(params)
+            date = self.last.get(user)
+            if date is None:
+                raise HTTPError(404, f"'{user}' has not answered yet")
+        try:
+            engine = get_engine(params.get("engine", "doomsday"))
+        except ValueError as err:
+            raise HTTPError(400, str(err))
+        explanation = engine.explain(date)
+        return {**explanation.to_dict(), "text": render_text(explanation)}
+
+    async def stats(self, params: dict) -> dict:
+        user = self.__user(params)
+        attempts, correct = await asyncio.to_thread(self.db.get_user_stats, user)
+        return {"user": user, "attempts": attempts, "correct": correct,
+                "accuracy": correct / attempts if attempts else None}
+
+    async def dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, dict]:
+        url = urlsplit(target)
+        routes = {("GET", "/next"): self.next_date, ("POST", "/answer"): self.answer,
+                  ("GET", "/explanation"): self.explanation, ("GET", "/stats"): self.stats}
+        try:
+            handler = routes.get((method, url.path))
+            if handler is None:
+                if any(path == url.path for _, path in routes):
+                    raise HTTPError(405, f"{method} not allowed on {url.path}")
+                raise HTTPError(404, f"unknown endpoint {url.path}")
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            if body:
+                try:
+                    payload = json.loads(body)
+                except ValueError as err:
+                    raise HTTPError(400, f"invalid JSON: {err}")
+                if not isinstance(payload, dict):
+                    raise HTTPError(400, "the JSON body has to be an object")
+                params.update(payload)
+            return 200, await handler(params)
+        except HTTPError as err:
+            return err.status, {"error": str(err)}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Minimal HTTP/1.1 with keep-alive, one request at a time per connection"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                try:
+                    status, payload = await self.dispatch(method, target, body)
+                except Exception as err:
+                    status, payload = 500, {"error": f"{type(err).__name__}: {err}"}
+                keep_alive = (version == "HTTP/1.1" and
+                              headers.get("connection", "").lower() != "close")
+                data = json.dumps(payload).encode()
+                head = (f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                        f"Content-Type: application/json\r\n"
+                        f"Content-Length: {len(data)}\r\n")
+                if not keep_alive:
+                    head += "Connection: close\r\n"
+                writer.write(head.encode("latin-1") + b"\r\n" + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass  # client went away or sent garbage
+        finally:
+            writer.close()
+
+
+async def serve(db: Database, host: str = "127.0.0.1", port: int = 8080,
+                **kwargs) -> asyncio.AbstractServer:
+    """Start serving in the running event loop (port 0 picks a free port)"""
+    service = QuizService(db, **kwargs)
+    return await asyncio.start_server(service.handle, host, port)
+
+
+async def run(args: argparse.Namespace) -> None:
+    with Database(args.db, write_behind=True, multi_user=True) as db:
+        server = await serve(db, args.host, args.port,
+                             start_year=args.start_year, end_year=args.end_year)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"quiz service on http://{host}:{port} (data/{args.db}.db)")
+        async with server:
+            await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local multi-user quiz service")
+    parser.add_argument("--db", default="quiz", help="data/<db>.db (default: quiz)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--start-year", type=int, default=1500)
+    parser.add_argument("--end-year", type=int, default=2500)
+    args = parser.parse_args()
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
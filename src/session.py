@@ -0,0 +1,227 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 14:13:04
+Description: Headless scripted session with optional cProfile/tracemalloc
+             reports per subsystem
+
+Plays N questions through the steps of `GUI.submit` without opening a
+window: the next question from the `QuestionPipeline` (`gen_random_date`),
+`parse_weekday` (`__translate_entry`), `Database.insert`, the explanation
+text for wrong answers and, every few questions, what the Statistics tab
+shows (accuracy table and `show_progress` chart). Every step is timed under
+its subsystem:
+    algorithm   question, answer parsing, explanation
+    storage     insert and the statistics queries
+    plotting    rendering the progress chart
+The questions are made in the calling thread, so a seed replays the same
+session and the profiles see all of the work.
+
+usage:
+    python src/session.py -n 500 --profile --tracemalloc [--out profile]
+
+@author: tsenoner
+"""
+import argparse
+import cProfile
+import contextlib
+import datetime
+import io
+import itertools
+import pstats
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Iterator
+
+from db_api import ACCURACY_CATEGORIES, Database
+from doomsday import Doomsday, parse_weekday, render_text
+from engines import ENGINES
+from instrumentation import Histogram
+from prefetch import QuestionPipeline
+from progress import render_progress
+from scheduler import Scheduler
+from synthetic import generate
+
+SESSION_DB = "session"
+OUT_DIR = Path(__file__).parents[1] / "profile"
+SUBSYSTEMS = ("algorithm", "storage", "plotting")
+# modules whose allocations count for a subsystem in the tracemalloc reports
+SUBSYSTEM_FILES: Dict[str, tuple] = {
+    "algorithm": ("*/anchors.py", "*/doomsday.py", "*/engines.py", "*/prefetch.py",
+                  "*/scheduler.py", "*/weekday_table.py"),
+    "storage": ("*/db_api.py", "*/sqlite3/*"),
+    "plotting": ("*/progress.py", "*/matplotlib/*"),
+}
+
+
+class Profiler:
+    """Wall time, and optionally cProfile stats and tracemalloc peaks, per subsystem"""
+
+    def __init__(self, cpu: bool = False, memory: bool = False, frames: int = 1) -> None:
+        self.cpu = cpu
+        self.memory = memory
+        self.frames = frames
+        self.times = {name: Histogram() for name in SUBSYSTEMS}
+        self.profiles = {name: cProfile.Profile() for name in SUBSYSTEMS} if cpu else {}
+        # largest allocation peak of one step and net growth in bytes
+        self.peaks = dict.fromkeys(SUBSYSTEMS, 0)
+        self.growth = dict.fromkeys(SUBSYSTEMS, 0)
+
+    @contextlib.contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        if self.memory:
+            start_memory, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        if self.cpu:
+            self.profiles[name].enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            if self.cpu:
+                self.profiles[name].disable()
+            if self.memory:
+                memory, peak = tracemalloc.get_traced_memory()
+                self.peaks[name] = max(self.peaks[name], peak - start_memory)
+                self.growth[name] += memory - start_memory
+            self.times[name].add(seconds * 1e6)
+
+    def write_reports(self, out_dir: Path, top: int = 25) -> None:
+        """<subsystem>.prof (pstats) and .txt (top functions) for cProfile,
+        <subsystem>.tracemalloc.txt for the allocations still alive"""
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, profile in self.profiles.items():
+            profile.dump_stats(out_dir / f"{name}.prof")
+            report = io.StringIO()
+            stats = pstats.Stats(profile, stream=report).strip_dirs()
+            stats.sort_stats("cumulative").print_stats(top)
+            stats.sort_stats("tottime").print_stats(top)
+            (out_dir / f"{name}.txt").write_text(report.getvalue())
+        if self.memory:
+            snapshot = tracemalloc.take_snapshot()
+            for name, patterns in SUBSYSTEM_FILES.items():
+                # by the allocating line, or by any frame of deeper tracebacks
+                filtered = snapshot.filter_traces(
+                    [tracemalloc.Filter(True, pattern, all_frames=self.frames > 1)
+                     for pattern in patterns])
+                lines = [f"{name}: largest step peak {self.peaks[name] / 1024:.1f} KiB, "
+                         f"net growth {self.growth[name] / 1024:.1f} KiB",
+                         f"top {top} allocations still alive at the end of the session:"]
+                for stat in filtered.statistics("lineno")[:top]:
+                    lines.append(str(stat))
+                (out_dir / f"{name}.tracemalloc.txt").write_text("\n".join(lines) + "\n")
+
+
+def scripted_answer(weekday: int, accuracy: float, rng: random.Random) -> str:
+    """What a player types: mostly the right weekday, in the forms the entry accepts"""
+    if rng.random() < 0.02:
+        return "?"  # not a weekday, takes the error path
+    if rng.random() >= accuracy:
+        weekday = (weekday + rng.randrange(1, 7)) % 7
+    name = Doomsday.weekdays[weekday]
+    return rng.choice((name, name[:3].lower(), str(weekday)))
+
+
+def run_session(db: Database, profiler: Profiler, n_questions: int, seed: int = 0,
+                accuracy: float = 0.7, stats_every: int = 10,
+                engine: str = "doomsday") -> Dict[str, int]:
+    rng = random.Random(seed)
+    scheduler = Scheduler(rng=random.Random(seed))
+    scheduler.warm_start(db)
+    counts = {"questions": 0, "correct": 0, "invalid": 0}
+    with QuestionPipeline(scheduler, depth=0, engine=engine) as pipeline:
+        with profiler.section("algorithm"):
+            question = pipeline.next()
+        while counts["questions"] < n_questions:
+            answer = scripted_answer(question.weekday_int, accuracy, rng)
+            with profiler.section("algorithm"):
+                weekday = parse_weekday(answer)
+                if weekday is not None:
+                    correct = weekday == question.weekday_int
+                    pipeline.record(question.date, correct)
+                    if not correct:
+                        render_text(question.explanation)
+            if weekday is None:
+                counts["invalid"] += 1
+                continue
+            with profiler.section("storage"):
+                db.insert(date=question.date, real_day=question.weekday_int,
+                          guessed_day=weekday)
+            counts["questions"] += 1
+            counts["correct"] += correct
+
+            if counts["questions"] % stats_every == 0:
+                # the Statistics tab: accuracy table and progress chart
+                with profiler.section("storage"):
+                    db.get_data_version()
+                    db.get_accuracy(ACCURACY_CATEGORIES[rng.randrange(len(ACCURACY_CATEGORIES))])
+                    summary = db.get_daily_summary()
+                with profiler.section("plotting"):
+                    render_progress(summary)
+
+            with profiler.section("algorithm"):
+                question = pipeline.next()
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=500, help="questions")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--accuracy", type=float, default=0.7,
+                        help="share of correct answers of the scripted player")
+    parser.add_argument("--stats-every", type=int, default=25,
+                        help="questions between two looks at the Statistics tab")
+    parser.add_argument("--history", type=int, default=20_000,
+                        help="synthetic attempts imported before the session")
+    parser.add_argument("--history-days", type=int, default=60,
+                        help="days the history is spread over (bars of the progress chart)")
+    parser.add_argument("--engine", choices=ENGINES, default="doomsday")
+    parser.add_argument("--write-behind", action="store_true",
+                        help="queue the inserts like the app (storage then only times the queueing)")
+    parser.add_argument("--profile", action="store_true", help="cProfile per subsystem")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="allocation peaks and top allocations per subsystem")
+    parser.add_argument("--frames", type=int, default=1,
+                        help="traceback depth of tracemalloc (deeper is much slower)")
+    parser.add_argument("--out", type=Path, default=OUT_DIR, help="report directory")
+    args = parser.parse_args()
+
+    profiler = Profiler(cpu=args.profile, memory=args.tracemalloc, frames=args.frames)
+    Database.remove_files(SESSION_DB)
+    with Database(SESSION_DB, write_behind=args.write_behind) as db:
+        start = datetime.datetime.now() - datetime.timedelta(days=args.history_days)
+        # one import, the indexes are rebuilt once
+        db.bulk_import(itertools.chain.from_iterable(
+            generate(args.history, args.seed, start, years=args.history_days / 365.25)))
+        # matplotlib is imported on the first chart, keep that out of the session
+        render_progress(db.get_daily_summary())
+        if args.tracemalloc:
+            # only the session itself, not the imports and the history
+            tracemalloc.start(args.frames)
+        counts = run_session(db, profiler, args.n, args.seed, args.accuracy,
+                             args.stats_every, args.engine)
+    if args.profile or args.tracemalloc:
+        profiler.write_reports(args.out)
+    Database.remove_files(SESSION_DB)
+
+    print(f"{counts['questions']} questions, {counts['correct']} correct, "
+          f"{counts['invalid']} invalid entries")
+    print(f"{'subsystem':<11}{'steps':>7}{'total s':>9}{'mean ms':>9}{'p99 ms':>9}"
+          + (f"{'peak KiB':>10}" if args.tracemalloc else ""))
+    for name, hist in profiler.times.items():
+        line = (f"{name:<11}{hist.count:>7}{hist.total / 1e6:>9.3f}"
+                f"{hist.total / max(hist.count, 1) / 1e3:>9.3f}{hist.percentile(0.99) / 1e3:>9.3f}")
+        if args.tracemalloc:
+            line += f"{profiler.peaks[name] / 1024:>10.1f}"
+        print(line)
+    if args.profile or args.tracemalloc:
+        print(f"reports in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
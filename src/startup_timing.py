@@ -0,0 +1,144 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:22:55
+Description: Cold start timing of the app (import time per module and time
+             to the first question) checked against a budget
+
+The first question is timed through `main.run`, the startup path of the
+app: opening (and migrating) the database with write-behind, the
+scheduler's warm start and the GUI. It runs on a fresh copy of data/log.db,
+topped up with `--history` synthetic attempts of the last months, so the
+budget also covers a long attempt history.
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import itertools
+import os
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+from db_api import Database
+from synthetic import generate
+
+SRC_DIR = Path(__file__).parent
+ROOT_DIR = SRC_DIR.parent
+APP_MODULES = ("main", "gui", "db_api", "doomsday", "explanation", "progress",
+               "tkinter", "matplotlib", "PIL")
+BUDGET_ENV = "DAYOFDATE_STARTUP_BUDGET_MS"
+DEFAULT_BUDGET_MS = 1000.0
+# populated template and the copy a run starts from, both in data/
+TEMPLATE_DB = "startup_template"
+STARTUP_DB = "startup_timing"
+
+# runs in a fresh interpreter with the database name as argument; prints the
+# ms until the first question is shown
+FIRST_QUESTION_SNIPPET = """
+import sys
+import time
+start = time.perf_counter()
+import main
+
+def on_ready(gui):
+    gui.root.update_idletasks()
+    print(f"{(time.perf_counter() - start) * 1e3:.1f}", flush=True)
+    gui.root.destroy()
+
+main.run(sys.argv[1], on_ready=on_ready)
+"""
+
+
+def import_times() -> Dict[str, float]:
+    """Cumulative import time in ms of the app modules (`python -X importtime`)"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                          cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        name = name.strip()
+        if name in APP_MODULES and cumulative.strip().isdigit():
+            times[name] = int(cumulative) / 1e3
+    return times
+
+
+def copy_db(source: Path, target: str) -> None:
+    """Consistent copy of `source` (also with a pending WAL) to `data/<target>.db`"""
+    Database.remove_files(target)
+    src = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True)
+    dst = sqlite3.connect(Database.path_of(target))
+    with dst:
+        src.backup(dst)
+    src.close()
+    dst.close()
+
+
+def make_template(source: Path, history: int) -> None:
+    """`source` plus `history` attempts of the last year as TEMPLATE_DB
+
+    Without a history the copy is left untouched, so an old schema is
+    migrated during the timed runs like on the first start after an update.
+    """
+    copy_db(source, TEMPLATE_DB)
+    if history > 0:
+        # recent attempts, nothing is due for the archive on exit
+        start = datetime.datetime.now() - datetime.timedelta(days=300)
+        with Database(TEMPLATE_DB) as db:
+            db.bulk_import(itertools.chain.from_iterable(
+                generate(history, start=start, years=0.8)))
+
+
+def time_to_first_question() -> float:
+    """ms from interpreter start of the app code until the first question is
+    drawn, on a fresh copy of the template"""
+    copy_db(Database.path_of(TEMPLATE_DB), STARTUP_DB)
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR))
+    try:
+        proc = subprocess.run([sys.executable, "-c", FIRST_QUESTION_SNIPPET, STARTUP_DB],
+                              cwd=ROOT_DIR, env=env, capture_output=True, text=True)
+    finally:
+        Database.remove_files(STARTUP_DB)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    return float(proc.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float,
+                        default=float(os.environ.get(BUDGET_ENV, DEFAULT_BUDGET_MS)),
+                        help=f"cold start budget (default: ${BUDGET_ENV} or {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--source", type=Path, default=ROOT_DIR / "data" / "log.db",
+                        help="database the runs start from (only copies are opened)")
+    parser.add_argument("--history", type=int, default=50_000,
+                        help="synthetic attempts added to the copy")
+    args = parser.parse_args()
+
+    print("import time (cumulative):")
+    for name, ms in sorted(import_times().items(), key=lambda item: -item[1]):
+        print(f"  {name:<12}{ms:>9.1f} ms")
+
+    make_template(args.source, args.history)
+    try:
+        startup = min(time_to_first_question() for _ in range(args.repeat))
+    except RuntimeError as err:
+        print(f"time to first question: not measurable ({err})")
+        sys.exit(2)
+    finally:
+        Database.remove_files(TEMPLATE_DB)
+    print(f"time to first question: {startup:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if startup > args.budget_ms:
+        print("REGRESSION: cold start exceeds the budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:55:50
+Description: Stress run of concurrent readers and writers on one on-disk
+             `Database`
+
+Writer threads keep inserting attempts while reader threads run the
+statistics queries and a streaming export. Checked along the way:
+- every read sees a consistent snapshot (rows == rollup total)
+- row counts never go backwards for a reader
+- with one synchronous writer, `get_last_inserted_rec` is the row just
+  inserted, whatever the readers do in between
+and at the end that no attempt got lost.
+
+usage:
+    python src/stress_db.py --seconds 10 --readers 4 --writers 2 [--write-behind]
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import itertools
+import random
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List
+
+import anchors
+from db_api import ACCURACY_CATEGORIES, Database
+from doomsday import random_date
+from instrumentation import Histogram
+from synthetic import generate
+
+STRESS_DB = "stress_db"
+
+
+class Stress:
+    def __init__(self, db: Database, n_writers: int, think: float) -> None:
+        self.db = db
+        self.n_writers = n_writers
+        self.think = think
+        self.stop = threading.Event()
+        self.lock = threading.Lock()
+        self.errors: List[str] = []
+        self.latencies: Dict[str, Histogram] = {}
+        self.inserted: Dict[str, int] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        with self.lock:
+            self.latencies.setdefault(name, Histogram()).add(seconds * 1e6)
+
+    def fail(self, message: str) -> None:
+        with self.lock:
+            self.errors.append(message)
+        self.stop.set()
+
+    def writer(self, idx: int) -> None:
+        rng = random.Random(idx)
+        user = f"writer-{idx}"
+        n_rows = 0
+        # last inserted rowid is per `Database`, only defined for a single writer
+        check_last = self.n_writers == 1 and not self.db.write_behind
+        try:
+            while not self.stop.is_set():
+                date = random_date(rng=rng)
+                real = anchors.weekday(date.year, date.month, date.day)
+                guess = real if rng.random() < 0.7 else rng.randrange(7)
+                start = time.perf_counter()
+                self.db.insert(date, real, guess, user=user)
+                self.record("insert", time.perf_counter() - start)
+                n_rows += 1
+                if check_last:
+                    rec = self.db.get_last_inserted_rec()
+                    if rec is None or (rec[2], rec[6]) != (date.toordinal(), user):
+                        self.fail(f"{user}: last inserted record is {rec}, not {date}")
+                time.sleep(self.think)
+        except Exception:
+            self.fail(traceback.format_exc())
+        finally:
+            with self.lock:
+                self.inserted[user] = n_rows
+
+    def reader(self, idx: int) -> None:
+        rng = random.Random(1_000 + idx)
+        last_count = 0
+        queries = itertools.cycle(["snapshot", "accuracy", "user_stats", "daily_summary",
+                                   "export"])
+        try:
+            while not self.stop.is_set():
+                query = next(queries)
+                start = time.perf_counter()
+                if query == "snapshot":
+                    # one statement, one snapshot: the rollup has to match
+                    n_rows, n_summary = self.db.get_data("""
+                        SELECT (SELECT COUNT(*) FROM dates),
+                               (SELECT IFNULL(SUM(n_correct + n_wrong), 0) FROM daily_summary);
+                        """)[0]
+                    if n_rows != n_summary:
+                        self.fail(f"reader {idx}: {n_rows} rows but {n_summary} in the rollup")
+                    if n_rows < last_count:
+                        self.fail(f"reader {idx}: row count went back {last_count} -> {n_rows}")
+                    last_count = n_rows
+                elif query == "accuracy":
+                    self.db.get_accuracy(rng.choice(ACCURACY_CATEGORIES))
+                elif query == "user_stats":
+                    self.db.get_user_stats(f"writer-{rng.randrange(self.n_writers)}")
+                elif query == "daily_summary":
+                    self.db.get_daily_summary()
+                else:
+                    now = datetime.datetime.now()
+                    recs = list(self.db.iter_range(now - datetime.timedelta(days=30), now))
+                    if any(first[1] > second[1] for first, second in zip(recs, recs[1:])):
+                        self.fail(f"reader {idx}: export not in time order")
+                self.record(query, time.perf_counter() - start)
+        except Exception:
+            self.fail(traceback.format_exc())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=1)
+    parser.add_argument("--write-behind", action="store_true")
+    parser.add_argument("--think-ms", type=float, default=1.0,
+                        help="pause of a writer between two inserts")
+    parser.add_argument("--rows", type=int, default=100_000,
+                        help="history imported before the run")
+    args = parser.parse_args()
+
+    Database.remove_files(STRESS_DB)
+    with Database(STRESS_DB, write_behind=args.write_behind, multi_user=True) as db:
+        # one import, the indexes are rebuilt once
+        db.bulk_import(itertools.chain.from_iterable(generate(
+            args.rows, start=datetime.datetime.now() - datetime.timedelta(days=180), years=0.5)))
+        stress = Stress(db, args.writers, args.think_ms / 1e3)
+        threads = [threading.Thread(target=stress.writer, args=(idx,), name=f"writer-{idx}")
+                   for idx in range(args.writers)]
+        threads += [threading.Thread(target=stress.reader, args=(idx,), name=f"reader-{idx}")
+                    for idx in range(args.readers)]
+        for thread in threads:
+            thread.start()
+        stress.stop.wait(args.seconds)
+        stress.stop.set()
+        for thread in threads:
+            thread.join()
+
+        # nothing lost: every writer's attempts are stored
+        n_rows = db.get_data("SELECT COUNT(*) FROM dates;")[0][0]
+        if n_rows != args.rows + sum(stress.inserted.values()):
+            stress.fail(f"{n_rows} rows stored, expected "
+                        f"{args.rows + sum(stress.inserted.values())}")
+        for user, n_inserted in stress.inserted.items():
+            if db.get_user_stats(user)[0] != n_inserted:
+                stress.fail(f"{user}: {db.get_user_stats(user)[0]} rows, inserted {n_inserted}")
+    Database.remove_files(STRESS_DB)
+
+    mode = "write-behind" if args.write_behind else "synchronous"
+    print(f"{args.writers} {mode} writer(s) ({args.think_ms:g} ms think time), "
+          f"{args.readers} reader(s), {args.seconds:.0f} s")
+    print(f"{'operation':<15}{'count':>9}{'per s':>9}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    for name, hist in sorted(stress.latencies.items()):
+        print(f"{name:<15}{hist.count:>9,}{hist.count / args.seconds:>9,.0f}"
+              f"{hist.percentile(0.50) / 1e3:>9.3f}{hist.percentile(0.99) / 1e3:>9.3f}"
+              f"{hist.percentile(1.0) / 1e3:>9.3f}")
+    if stress.errors:
+        print(f"\n{len(stress.errors)} error(s):")
+        for error in stress.errors[:10]:
+            print(error)
+        sys.exit(1)
+    print("\nok: consistent snapshots, no lost attempts")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:25:23
+Description: Synthetic attempt history for scale testing a `dates` table
+
+usage:
+    python src/synthetic.py scale_1m --rows 1000000 --years 3 --curve logistic
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import math
+import time
+from random import Random
+from typing import Callable, Dict, Iterator, List
+
+import anchors
+from db_api import Database
+from doomsday import random_date
+
+PROTECTED_DBS = ("log",)
+
+
+def constant_curve(progress: float, start: float, end: float) -> float:
+    return start
+
+
+def linear_curve(progress: float, start: float, end: float) -> float:
+    return start + (end - start) * progress
+
+
+def logistic_curve(progress: float, start: float, end: float) -> float:
+    """Slow start, fast learning in the middle, plateau at the end"""
+    return start + (end - start) / (1 + math.exp(-12 * (progress - 0.5)))
+
+
+# accuracy as a function of the position in the history (0 -> 1)
+CURVES: Dict[str, Callable[[float, float, float], float]] = {
+    "constant": constant_curve,
+    "linear": linear_curve,
+    "logistic": logistic_curve,
+}
+
+
+def generate(n_rows: int, seed: int = 0, start: datetime.datetime = None,
+             years: float = 2.0, curve: str = "logistic", start_accuracy: float = 0.4,
+             end_accuracy: float = 0.9, chunk_size: int = 50_000) -> Iterator[List[tuple]]:
+    """Yield chunks of (time, date, real_day, guessed_day, correct) rows,
+    weekdays as ints (0 = Sunday)
+
+    Timestamps are increasing and spread over `years`; only one chunk is held
+    in memory at a time. The same seed always gives the same history.
+    """
+    rng = Random(seed)
+    accuracy = CURVES[curve]
+    if start is None:
+        start = datetime.datetime(2021, 12, 1, 8, 0)
+    step = years * 365.25 * 86400 / max(n_rows, 1)
+    for offset in range(0, n_rows, chunk_size):
+        rows = []
+        for idx in range(offset, min(offset + chunk_size, n_rows)):
+            time_ = start + datetime.timedelta(seconds=(idx + rng.random()) * step)
+            date = random_date(rng=rng)
+            real = anchors.weekday(date.year, date.month, date.day)
+            if rng.random() < accuracy(idx / max(n_rows - 1, 1), start_accuracy, end_accuracy):
+                guessed = real
+            else:
+                guessed = (real + rng.randrange(1, 7)) % 7
+            rows.append((time_, date, real, guessed, real == guessed))
+        yield rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fill data/<db_name>.db with synthetic attempts")
+    parser.add_argument("db_name", help="target database, never 'log'")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=datetime.date.fromisoformat, default=datetime.date(2021, 12, 1),
+                        help="first day of the history (YYYY-MM-DD)")
+    parser.add_argument("--years", type=float, default=2.0, help="span of the history")
+    parser.add_argument("--curve", choices=CURVES, default="logistic")
+    parser.add_argument("--start-accuracy", type=float, default=0.4)
+    parser.add_argument("--end-accuracy", type=float, default=0.9)
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--replace", action="store_true",
+                        help="delete the database before filling it")
+    args = parser.parse_args()
+
+    if args.db_name in PROTECTED_DBS:
+        parser.error(f"refusing to write synthetic data into '{args.db_name}'")
+    if args.replace:
+        Database.remove_files(args.db_name)
+
+    start = datetime.datetime.combine(args.start, datetime.time(8, 0))
+    begin = time.perf_counter()
+    n_written = 0
+    with Database(args.db_name) as db:
+        for rows in generate(args.rows, args.seed, start, args.years, args.curve,
+                             args.start_accuracy, args.end_accuracy, args.chunk_size):
+            db.insert_many(rows)
+            n_written += len(rows)
+            print(f"\r{n_written:,} / {args.rows:,} rows", end="", flush=True)
+    seconds = time.perf_counter() - begin
+    print(f"\n{n_written:,} rows in {seconds:.1f} s ({n_written / seconds:,.0f} rows/s)"
+          f" -> {Database.path_of(args.db_name)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:30:34
+Description: Streaming export and bulk import of the attempt history
+
+usage:
+    python src/transfer.py export log history.jsonl
+    python src/transfer.py import merged history.csv
+
+@author: tsenoner
+"""
+import argparse
+import csv
+import datetime
+import json
+import sys
+import time
+from typing import Iterator, TextIO
+
+from db_api import Database
+
+FIELDS = ("time", "date", "real_day", "guessed_day", "correct", "user")
+
+
+def file_format(path: str) -> str:
+    return "jsonl" if path.endswith((".jsonl", ".json")) else "csv"
+
+
+def export_history(db: Database, handle: TextIO, fmt: str = "csv") -> int:
+    """Write all attempts, including the archived ones, to `handle` in constant memory"""
+    n_rows = 0
+    everything = (datetime.datetime.min, datetime.datetime.max)
+    if fmt == "csv":
+        writer = csv.writer(handle, lineterminator="\n")
+        writer.writerow(FIELDS)
+    for _, time_, date, real_day, guessed_day, correct, user in db.iter_range(*everything, decode=True):
+        values = (time_.isoformat(sep=" ", timespec="milliseconds"), date.isoformat(),
+                  real_day, guessed_day, int(correct), user)
+        if fmt == "csv":
+            writer.writerow(values)  # a missing user is written as ""
+        else:
+            handle.write(json.dumps(dict(zip(FIELDS, values))) + "\n")
+        n_rows += 1
+    return n_rows
+
+
+def read_history(handle: TextIO, fmt: str = "csv") -> Iterator[tuple]:
+    """Stream (time, date, real_day, guessed_day, correct, user) rows from an export"""
+    records = csv.DictReader(handle) if fmt == "csv" else map(json.loads, handle)
+    for record in records:
+        yield (datetime.datetime.fromisoformat(record["time"]),
+               datetime.date.fromisoformat(record["date"]),
+               record["real_day"], record["guessed_day"], int(record["correct"]),
+               record.get("user") or None)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Move attempt histories between databases")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command in ("export", "import"):
+        sub = subparsers.add_parser(command)
+        sub.add_argument("db_name", help="data/<db_name>.db")
+        sub.add_argument("path", help="CSV or JSONL file, '-' for stdin/stdout")
+        sub.add_argument("--format", choices=("csv", "jsonl"),
+                         help="default: by file extension, else csv")
+    args = parser.parse_args()
+    fmt = args.format or file_format(args.path)
+
+    start = time.perf_counter()
+    with Database(args.db_name) as db:
+        if args.command == "export":
+            handle = sys.stdout if args.path == "-" else open(args.path, "w", newline="")
+            try:
+                n_rows = export_history(db, handle, fmt)
+            finally:
+                if handle is not sys.stdout:
+                    handle.close()
+        else:
+            handle = sys.stdin if args.path == "-" else open(args.path, newline="")
+            try:
+                n_rows = db.bulk_import(read_history(handle, fmt))
+            finally:
+                if handle is not sys.stdin:
+                    handle.close()
+    seconds = time.perf_counter() - start
+    print(f"{args.command}ed {n_rows:,} rows in {seconds:.2f} s "
+          f"({n_rows / max(seconds, 1e-9):,.0f} rows/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
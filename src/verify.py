@@ -0,0 +1,127 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:27:01
+Description: Exhaustive differential check of the doomsday engines against
+             `datetime` for every date of years 1 - 9999
+
+usage:
+    python src/verify.py --engine scalar --workers 4
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import functools
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Tuple
+
+import anchors
+import engines
+from doomsday import Doomsday
+
+
+def scalar_engine(dates: List[datetime.date]) -> List[int]:
+    return [Doomsday(date).get_weekday()[0] for date in dates]
+
+
+def anchors_engine(dates: List[datetime.date]) -> List[int]:
+    return [anchors.weekday(date.year, date.month, date.day) for date in dates]
+
+
+def batch_engine(dates: List[datetime.date]) -> List[int]:
+    from doomsday_batch import batch_weekdays
+    return batch_weekdays(dates).tolist()
+
+
+def table_engine(dates: List[datetime.date]) -> List[int]:
+    from weekday_table import open_table
+    with open_table() as table:
+        return [table.weekday(date.year, date.month, date.day) for date in dates]
+
+
+def registry_engine(name: str, dates: List[datetime.date]) -> List[int]:
+    engine = engines.get_engine(name)
+    return [engine.weekday(date.year, date.month, date.day) for date in dates]
+
+
+ENGINES: Dict[str, Callable[[List[datetime.date]], List[int]]] = {
+    "scalar": scalar_engine,
+    "anchors": anchors_engine,
+    "batch": batch_engine,
+    "table": table_engine,
+}
+# the remaining methods of the engine registry
+ENGINES.update({name: functools.partial(registry_engine, name)
+                for name in engines.ENGINES if name not in ENGINES})
+
+
+def check_years(engine: str, first_year: int, last_year: int,
+                max_report: int) -> Tuple[int, int, List[tuple]]:
+    """Compare one engine with `date.isoweekday()` for a range of years
+
+    Returns (dates checked, mismatches, first `max_report` mismatches).
+    """
+    start = datetime.date(first_year, 1, 1)
+    n_days = (datetime.date(last_year, 12, 31) - start).days + 1
+    dates = [start + datetime.timedelta(days=idx) for idx in range(n_days)]
+    try:
+        result = ENGINES[engine](dates)
+    except Exception:
+        # find the dates the engine cannot handle at all
+        result = []
+        for date in dates:
+            try:
+                result.append(ENGINES[engine]([date])[0])
+            except Exception as err:
+                result.append(f"{type(err).__name__}: {err}")
+    mismatches = [(date.isoformat(), expected, got)
+                  for date, got in zip(dates, result)
+                  if got != (expected := date.isoweekday() % 7)]
+    return len(dates), len(mismatches), mismatches[:max_report]
+
+
+def year_ranges(first_year: int, last_year: int, step: int) -> List[Tuple[int, int]]:
+    return [(year, min(year + step - 1, last_year))
+            for year in range(first_year, last_year + 1, step)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify a doomsday engine against datetime")
+    parser.add_argument("--engine", choices=ENGINES, default="scalar")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes (default: number of CPUs)")
+    parser.add_argument("--first-year", type=int, default=datetime.MINYEAR)
+    parser.add_argument("--last-year", type=int, default=datetime.MAXYEAR)
+    parser.add_argument("--years-per-task", type=int, default=100)
+    parser.add_argument("--max-report", type=int, default=20,
+                        help="mismatches listed in the report")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    n_dates = n_mismatches = 0
+    examples = []
+    ranges = year_ranges(args.first_year, args.last_year, args.years_per_task)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = [executor.submit(check_years, args.engine, first, last, args.max_report)
+                   for first, last in ranges]
+        for future in futures:
+            checked, mismatches, found = future.result()
+            n_dates += checked
+            n_mismatches += mismatches
+            examples.extend(found[:args.max_report - len(examples)])
+    seconds = time.perf_counter() - start
+
+    print(f"engine: {args.engine}, years {args.first_year}-{args.last_year}")
+    print(f"checked {n_dates:,} dates in {seconds:.1f} s ({n_dates / seconds:,.0f} dates/s)")
+    print(f"mismatches: {n_mismatches:,}")
+    for date, expected, got in examples:
+        print(f"  {date}: expected {expected}, got {got}")
+    if n_mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
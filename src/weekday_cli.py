@@ -0,0 +1,177 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:25:59
+Description: Streaming date -> weekday pipeline for stdin or large CSV/JSONL files
+
+usage:
+    python src/weekday_cli.py dates.csv --column date --workers 4 > weekdays.csv
+    cat dates.txt | python src/weekday_cli.py - --to jsonl --explain
+    python src/weekday_cli.py dates.txt --engine zeller --to jsonl --explain
+
+@author: tsenoner
+"""
+import argparse
+import collections
+import csv
+import datetime
+import io
+import json
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterator, List, Optional, TextIO, Tuple
+
+import engines
+from doomsday import Doomsday
+
+VALUE_COLUMNS = ("century_doomsday", "abbr_year", "b", "c", "d", "e",
+                 "year_doomsday", "closest_doomsday", "diff")
+
+
+def parse_date(text: str) -> datetime.date:
+    """ISO (YYYY-MM-DD) or the app format (DD-MM-YYYY)"""
+    text = text.strip()
+    if len(text) > 4 and text[2] == "-" and text[5:6] == "-":
+        day, month, year = text.split("-")
+        return datetime.date(int(year), int(month), int(day))
+    return datetime.date.fromisoformat(text)
+
+
+def extract(line: str, in_format: str, column: Optional[int], key: str) -> str:
+    if in_format == "csv":
+        return next(csv.reader([line]))[column]
+    if in_format == "jsonl":
+        return json.loads(line)[key]
+    return line
+
+
+def process_chunk(lines: List[str], in_format: str, out_format: str, explain: bool,
+                  column: Optional[int] = None, key: str = "date",
+                  engine_name: str = "doomsday") -> Tuple[str, int, int]:
+    """Convert a chunk of input lines into output text (runs in the workers)
+
+    Returns the output text, the number of rows and the number of errors.
+    """
+    engine = engines.get_engine(engine_name)
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    n_errors = 0
+    for line in lines:
+        try:
+            raw = extract(line.rstrip("\r\n"), in_format, column, key)
+            date = parse_date(raw)
+        # TypeError/AttributeError: JSON that is no object or no date string
+        except (ValueError, KeyError, IndexError, StopIteration, TypeError,
+                AttributeError) as err:
+            n_errors += 1
+            if out_format == "csv":
+                writer.writerow([line.strip(), "", "", f"error: {err}"] +
+                                ([""] * len(VALUE_COLUMNS) if explain else []))
+            else:
+                out.write(json.dumps({"input": line.strip(), "error": str(err)}) + "\n")
+            continue
+
+        if explain:
+            explanation = engine.explain(date)
+            weekday_int = explanation.weekday_int
+        else:
+            weekday_int = engine.weekday(date.year, date.month, date.day)
+        weekday = Doomsday.weekdays[weekday_int]
+
+        if out_format == "csv":
+            row = [date.isoformat(), weekday_int, weekday, ""]
+            if explain:
+                row += [getattr(explanation, name) for name in VALUE_COLUMNS]
+            writer.writerow(row)
+        else:
+            record = {"date": date.isoformat(), "weekday_int": weekday_int, "weekday": weekday}
+            if explain:
+                record["explanation"] = explanation.to_dict()
+            out.write(json.dumps(record) + "\n")
+    return out.getvalue(), len(lines), n_errors
+
+
+def chunks(handle: TextIO, chunk_size: int) -> Iterator[List[str]]:
+    """Non-blank input lines in chunks of at most `chunk_size`"""
+    while True:
+        block = list(islice(handle, chunk_size))
+        if not block:
+            return
+        lines = [line for line in block if line.strip()]
+        if lines:
+            yield lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream dates to weekdays")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="text/CSV/JSONL file or '-' for stdin (default)")
+    parser.add_argument("--from", dest="in_format", choices=("lines", "csv", "jsonl"),
+                        help="input format (default: by file extension, else lines)")
+    parser.add_argument("--to", dest="out_format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--column", default="date", help="date column (CSV) or key (JSONL)")
+    parser.add_argument("--explain", action="store_true",
+                        help="add the values of every explanation step")
+    parser.add_argument("--engine", choices=engines.ENGINES, default="doomsday",
+                        help="weekday algorithm (CSV --explain columns need doomsday)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="process pool size, 0 computes in this process")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+    if args.explain and args.out_format == "csv" and args.engine != "doomsday":
+        parser.error("--explain with CSV output needs --engine doomsday, use --to jsonl")
+
+    in_format = args.in_format
+    if in_format is None:
+        suffix = args.input.rsplit(".", 1)[-1].lower() if "." in args.input else ""
+        in_format = suffix if suffix in ("csv", "jsonl") else "lines"
+
+    handle = sys.stdin if args.input == "-" else open(args.input, newline="")
+    out = sys.stdout
+    column = None
+    if in_format == "csv":
+        header = next(csv.reader([handle.readline()]), [])
+        if args.column not in header:
+            parser.error(f"no column '{args.column}' in the CSV header {header}")
+        column = header.index(args.column)
+    if args.out_format == "csv":
+        header = ["date", "weekday_int", "weekday", "error"]
+        out.write(",".join(header + (list(VALUE_COLUMNS) if args.explain else [])) + "\n")
+
+    n_rows = n_errors = 0
+    start = time.perf_counter()
+    task_args = (in_format, args.out_format, args.explain, column, args.column, args.engine)
+    try:
+        if args.workers > 0:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                # bounded number of chunks in flight, written in input order
+                pending = collections.deque()
+                for lines in chunks(handle, args.chunk_size):
+                    pending.append(executor.submit(process_chunk, lines, *task_args))
+                    if len(pending) >= 2 * args.workers:
+                        text, rows, errors = pending.popleft().result()
+                        out.write(text)
+                        n_rows, n_errors = n_rows + rows, n_errors + errors
+                while pending:
+                    text, rows, errors = pending.popleft().result()
+                    out.write(text)
+                    n_rows, n_errors = n_rows + rows, n_errors + errors
+        else:
+            for lines in chunks(handle, args.chunk_size):
+                text, rows, errors = process_chunk(lines, *task_args)
+                out.write(text)
+                n_rows, n_errors = n_rows + rows, n_errors + errors
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    out.flush()
+
+    seconds = time.perf_counter() - start
+    print(f"{n_rows:,} rows ({n_errors:,} errors) in {seconds:.2f} s "
+          f"-> {n_rows / max(seconds, 1e-9):,.0f} rows/s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# !/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created on: Sun 18 Oct 2026 13:40:55
+Description: Memory-mapped weekday table of one 400-year Gregorian cycle
+
+The file holds one byte (0 = Sunday) for each of the 146,097 days of a
+400-year cycle, behind a header with a format version and a CRC32 of the
+table. Readers `mmap` it read-only, so every process shares the same page
+cache copy. Files with another version or a wrong checksum are rejected.
+
+usage:
+    python src/weekday_table.py --build
+    python src/weekday_table.py --check
+
+@author: tsenoner
+"""
+import argparse
+import datetime
+import mmap
+import os
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Tuple
+
+import anchors
+
+if TYPE_CHECKING:
+    import numpy as np  # optional, only needed by `WeekdayTable.weekdays`
+
+MAGIC = b"DOWT"
+TABLE_VERSION = 1
+CYCLE_YEARS = 400
+CYCLE_DAYS = 146_097
+# magic, format version, number of entries, CRC32 of the entries
+HEADER = struct.Struct("<4sHII")
+DEFAULT_PATH = Path(__file__).parents[1] / "data" / "weekdays.bin"
+# the table starts on January 1st of a year divisible by 400
+CYCLE_START_ORDINAL = datetime.date(2000, 1, 1).toordinal()
+
+# day of the cycle of January 1st and leap flag per year of the cycle
+YEAR_STARTS: Tuple[int, ...] = tuple(
+    sum(365 + anchors.is_leap(year) for year in range(cycle_year))
+    for cycle_year in range(CYCLE_YEARS))
+YEAR_LEAPS: Tuple[int, ...] = tuple(int(anchors.is_leap(year)) for year in range(CYCLE_YEARS))
+
+
+def build_entries() -> bytes:
+    """Weekdays of the cycle years 2000 - 2399 (= year % 400 of 0 - 399)"""
+    entries = bytearray()
+    for cycle_year in range(CYCLE_YEARS):
+        year = 2000 + cycle_year
+        for month in range(1, 13):
+            n_days = (anchors.MONTH_STARTS[YEAR_LEAPS[cycle_year]][month]
+                      if month < 12 else 365 + YEAR_LEAPS[cycle_year]) \
+                - anchors.MONTH_STARTS[YEAR_LEAPS[cycle_year]][month - 1]
+            entries.extend(anchors.weekday(year, month, day) for day in range(1, n_days + 1))
+    assert len(entries) == CYCLE_DAYS
+    return bytes(entries)
+
+
+def build(path: Path = DEFAULT_PATH) -> Path:
+    """Write the table; replaced atomically, so open readers are never torn"""
+    entries = build_entries()
+    path = Path(path)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, TABLE_VERSION, len(entries), zlib.crc32(entries)))
+        handle.write(entries)
+    os.replace(tmp_path, path)
+    return path
+
+
+class WeekdayTable:
+    """Read-only `mmap` of a table written by `build`"""
+
+    def __init__(self, path: Path = DEFAULT_PATH) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self.__map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.__validate()
+        except ValueError:
+            self.__map.close()
+            raise
+
+    def __validate(self) -> None:
+        if len(self.__map) != HEADER.size + CYCLE_DAYS:
+            raise ValueError(f"{self.path}: unexpected size {len(self.__map)}")
+        magic, version, n_entries, crc = HEADER.unpack_from(self.__map)
+        if magic != MAGIC or version != TABLE_VERSION or n_entries != CYCLE_DAYS:
+            raise ValueError(f"{self.path}: not a version {TABLE_VERSION} weekday table")
+        if zlib.crc32(memoryview(self.__map)[HEADER.size:]) != crc:
+            raise ValueError(f"{self.path}: checksum mismatch")
+
+    def __enter__(self) -> "WeekdayTable":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        self.__map.close()
+
+    def weekday(self, year: int, month: int, day: int) -> int:
+        """Weekday as int (0 = Sunday), without any doomsday arithmetic"""
+        cycle_year = year % CYCLE_YEARS
+        return self.__map[HEADER.size + YEAR_STARTS[cycle_year] + day - 1 +
+                          anchors.MONTH_STARTS[YEAR_LEAPS[cycle_year]][month - 1]]
+
+    def weekday_of(self, date: datetime.date) -> int:
+        return self.__map[HEADER.size + (date.toordinal() - CYCLE_START_ORDINAL) % CYCLE_DAYS]
+
+    def weekdays(self, ordinals) -> "np.ndarray":
+        """Weekdays of an array of proleptic ordinals, on a zero-copy view of the map"""
+        import numpy as np
+        entries = np.frombuffer(self.__map, dtype=np.uint8, count=CYCLE_DAYS,
+                                offset=HEADER.size)
+        return entries[(np.asarray(ordinals, dtype=np.int64) - CYCLE_START_ORDINAL) % CYCLE_DAYS]
+
+
+def open_table(path: Path = DEFAULT_PATH) -> WeekdayTable:
+    """Open the table, (re)building it if it is missing, stale or corrupted"""
+    try:
+        return WeekdayTable(path)
+    except (FileNotFoundError, ValueError):
+        build(path)
+        return WeekdayTable(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or check the weekday table")
+    parser.add_argument("--path", type=Path, default=DEFAULT_PATH)
+    parser.add_argument("--build", action="store_true", help="(re)write the table")
+    parser.add_argument("--check", action="store_true",
+                        help="validate the table and compare it with datetime")
+    args = parser.parse_args()
+
+    if args.build or not args.path.exists():
+        print(f"wrote {build(args.path)}")
+    if args.check:
+        try:
+            table = WeekdayTable(args.path)
+        except ValueError as err:
+            sys.exit(f"invalid: {err}")
+        with table:
+            start = datetime.date(2000, 1, 1)
+            for offset in range(CYCLE_DAYS):
+                date = start + datetime.timedelta(days=offset)
+                expected = date.isoweekday() % 7
+                if table.weekday(date.year, date.month, date.day) != expected or \
+                        table.weekday_of(date) != expected:
+                    sys.exit(f"wrong weekday for {date}")
+        print(f"{args.path}: ok ({CYCLE_DAYS:,} days)")
+
+
+if __name__ == "__main__":
+    main()